@@ -85,3 +85,30 @@ class Atmosphere(ABC):
         Returns:
             float: Dynamic viscosity of air in Pascal-second (Pa-s).
         """
+
+    def get_properties(
+        self, y_amsl: float
+    ) -> tuple[float, float, float, float]:
+        """
+        Get the air density, air pressure, acceleration due to gravity and
+        speed of sound at the given altitude above mean sea level (AMSL), in
+        a single call.
+
+        Flight simulations need all of them at every altitude. Models that
+        evaluate the properties from a shared state should override this
+        method to evaluate that state only once.
+
+        Args:
+            y_amsl (float): Altitude above mean sea level in meters.
+
+        Returns:
+            tuple[float, float, float, float]: Air density in kg/m^3, air
+            pressure in Pa, acceleration due to gravity in m/s^2 and speed
+            of sound in m/s.
+        """
+        return (
+            self.get_density(y_amsl),
+            self.get_pressure(y_amsl),
+            self.get_gravity(y_amsl),
+            self.get_sonic_velocity(y_amsl),
+        )
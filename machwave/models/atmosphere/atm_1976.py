@@ -26,6 +26,17 @@ class Atmosphere1976(Atmosphere):
     def get_sonic_velocity(self, y_amsl: float) -> float:
         return ATMOSPHERE_1976(y_amsl).v_sonic
 
+    def get_properties(
+        self, y_amsl: float
+    ) -> tuple[float, float, float, float]:
+        state = ATMOSPHERE_1976(y_amsl)
+        return (
+            state.rho,
+            state.P,
+            ATMOSPHERE_1976.gravity(y_amsl),
+            state.v_sonic,
+        )
+
     def get_wind_velocity(self, y_amsl: float) -> tuple[float, float]:
         """
         7 m/s wind velocity in both x and y directions.
@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 import numpy as np
-from plotly import graph_objects as go
 
 from machwave.services.decorators import validate_assertions
 
@@ -263,8 +262,9 @@ class Grain:
 
         :rtype: float
         """
-        return np.sum(
-            [grain.length + grain.spacing for grain in self.segments]
+        return sum(
+            (segment.length + segment.spacing for segment in self.segments),
+            0.0,
         )
 
     @property
@@ -303,8 +303,9 @@ class Grain:
         :return float: Instant burn area, in m^2 and in function of web
         :rtype: float
         """
-        return np.sum(
-            [segment.get_burn_area(web_distance) for segment in self.segments]
+        return sum(
+            (segment.get_burn_area(web_distance) for segment in self.segments),
+            0.0,
         )
 
     def get_propellant_volume(self, web_distance: float) -> float:
@@ -315,8 +316,9 @@ class Grain:
         :return: Instant propellant volume, in m^3 and in function of web
         :rtype: float
         """
-        return np.sum(
-            [segment.get_volume(web_distance) for segment in self.segments]
+        return sum(
+            (segment.get_volume(web_distance) for segment in self.segments),
+            0.0,
         )
 
     def get_mass_flux_per_segment(
@@ -329,22 +331,28 @@ class Grain:
         Returns a numpy multidimensional array with the mass flux for each
         grain.
         """
-        segment_mass_flux = np.zeros(
-            (self.segment_count, np.size(web_distance))
+        # Burn and port areas of every segment at every web distance. Each
+        # is evaluated once, instead of once per downstream segment:
+        burn_areas = np.array(
+            [
+                [segment.get_burn_area(web) for web in web_distance]
+                for segment in self.segments
+            ]
         )
+        port_areas = np.array(
+            [
+                [segment.get_port_area(web) for web in web_distance]
+                for segment in self.segments
+            ]
+        )
+        mass_generation_rate = propellant_density * np.asarray(burn_rate)
 
-        for j in range(self.segment_count):  # iterating through each segment
-            for i in range(np.size(burn_rate)):
-                core_area = self.segments[j].get_port_area(web_distance[i])
-                burn_area = 0
-
-                for k in range(j + 1):
-                    burn_area = burn_area + self.segments[j - k].get_burn_area(
-                        web_distance[i]
-                    )
+        # Burn area of each segment and of all upstream segments, as a
+        # running (prefix) sum along the grain:
+        upstream_burn_areas = np.cumsum(burn_areas, axis=0)
 
-                segment_mass_flux[j, i] = (
-                    burn_area * propellant_density * burn_rate[i]
-                ) / (core_area)
+        segment_mass_flux = (
+            upstream_burn_areas * mass_generation_rate / port_areas
+        )
 
         return segment_mass_flux
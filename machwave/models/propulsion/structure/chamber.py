@@ -2,6 +2,8 @@
 Stores MotorStructure class and methods.
 """
 
+from typing import Union
+
 import numpy as np
 
 from machwave.models.materials import Material
@@ -42,9 +44,8 @@ class CombustionChamber:
     def casing_inner_radius(self) -> float:
         return self.casing_inner_diameter / 2
 
-    @property
+    @staticmethod
     def chamber_length(
-        self,
         grain_length: float,
         grain_count: int,
         grain_spacing: float,
@@ -63,6 +64,7 @@ class CombustionChamber:
     ) -> float:
         """
         Returns the thickness of a planar bulkhead pressure vessel.
+        Accepts arrays.
         """
         return self.inner_diameter * (
             np.sqrt(
@@ -96,7 +98,7 @@ class CombustionChamber:
     def get_casing_safety_factor(self, chamber_pressure: np.ndarray) -> float:
         """
         Returns the thickness for a cylindrical pressure vessel, using
-        Von Misses criteria.
+        Von Misses criteria. Accepts an array of chamber pressures.
         """
         casing_yield_strength = self.casing_material.yield_strength
         max_chamber_pressure = chamber_pressure
@@ -145,9 +147,12 @@ class BoltedCombustionChamber(CombustionChamber):
     def get_shear_area(self) -> float:
         return (self.screw_diameter**2) * np.pi * 0.25
 
-    def get_tear_area(self, screw_count: int) -> float:
+    def get_tear_area(
+        self, screw_count: Union[int, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """
-        Calculates tear area for screw section.
+        Calculates tear area for screw section. The screw count may be an
+        array, in which case one area is returned per screw count.
         """
         return (
             (
@@ -172,56 +177,52 @@ class BoltedCombustionChamber(CombustionChamber):
         )
 
     def get_force_on_each_fastener(
-        self, screw_count: int, chamber_pressure: float
-    ) -> float:
+        self, screw_count: Union[int, np.ndarray], chamber_pressure: float
+    ) -> Union[float, np.ndarray]:
         return (
             chamber_pressure * (np.pi * (self.inner_diameter / 2) ** 2)
         ) / screw_count
 
     def get_optimal_fasteners(self, chamber_pressure: np.ndarray):
+        """
+        Evaluates the fastener safety factors for every screw count up to
+        max_screw_count and returns the best screw count. Accepts arrays,
+        with screw counts along the last axis of the results.
+        """
+        # Trailing axis along which the screw count varies:
+        chamber_pressure = np.asarray(chamber_pressure)[..., np.newaxis]
+
         max_screw_count = self.max_screw_count
         casing_yield_strength = self.casing_material.yield_strength
         screw_ultimate_strength = self.screw_material.ultimate_strength
 
-        shear_safety_factor = np.zeros(max_screw_count)
-        tear_safety_factor = np.zeros(max_screw_count)
-        compression_safety_factor = np.zeros(max_screw_count)
+        # Every screw count is evaluated at once, as an array:
+        screw_count = np.arange(1, max_screw_count + 1)
 
-        for screw_count in range(1, max_screw_count + 1):
-            shear_area = self.get_shear_area()
-            tear_area = self.get_tear_area(screw_count)
-            compression_area = self.get_compression_area()
+        shear_area = self.get_shear_area()
+        tear_area = self.get_tear_area(screw_count)
+        compression_area = self.get_compression_area()
 
-            force_on_each_fastener = self.get_force_on_each_fastener(
-                screw_count=screw_count, chamber_pressure=chamber_pressure
-            )
+        force_on_each_fastener = self.get_force_on_each_fastener(
+            screw_count=screw_count, chamber_pressure=chamber_pressure
+        )
 
-            shear_stress = force_on_each_fastener / shear_area
-            shear_safety_factor[screw_count - 1] = (
-                screw_ultimate_strength / shear_stress
-            )
+        shear_stress = force_on_each_fastener / shear_area
+        shear_safety_factor = screw_ultimate_strength / shear_stress
 
-            tear_stress = force_on_each_fastener / tear_area
-            tear_safety_factor[screw_count - 1] = (
-                casing_yield_strength / np.sqrt(3)
-            ) / tear_stress
+        tear_stress = force_on_each_fastener / tear_area
+        tear_safety_factor = (casing_yield_strength / np.sqrt(3)) / tear_stress
 
-            compression_stress = force_on_each_fastener / compression_area
-            compression_safety_factor[screw_count - 1] = (
-                casing_yield_strength / compression_stress
-            )
+        compression_stress = force_on_each_fastener / compression_area
+        compression_safety_factor = casing_yield_strength / compression_stress
 
-        fastener_safety_factor = np.vstack(
-            (
-                shear_safety_factor,
-                tear_safety_factor,
-                compression_safety_factor,
-            )
-        )
-        max_safety_factor_fastener = np.max(
-            np.min(fastener_safety_factor, axis=0)
+        # The governing (lowest) safety factor of each screw count:
+        min_safety_factor = np.minimum(
+            np.minimum(shear_safety_factor, tear_safety_factor),
+            compression_safety_factor,
         )
-        optimal_fasteners = np.argmax(np.min(fastener_safety_factor, axis=0))
+        max_safety_factor_fastener = np.max(min_safety_factor, axis=-1)
+        optimal_fasteners = np.argmax(min_safety_factor, axis=-1)
 
         return (
             optimal_fasteners,
@@ -56,7 +56,7 @@ class Nozzle:
         chamber: CombustionChamber,
     ):
         """
-        Returns nozzle convergent and divergent thickness.
+        Returns nozzle convergent and divergent thickness. Accepts arrays.
         """
         nozzle_conv_thickness = self.get_nozzle_wall_thickness(
             chamber_pressure,
@@ -1,10 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, List, Optional
+import itertools
+from typing import Any, List, Optional, Type
 import uuid
 
 import numpy as np
-import plotly.graph_objects as go
 
 from machwave.montecarlo.random import get_random_generator
 from machwave.operations import Operation
@@ -14,6 +15,23 @@ from machwave.services.common import obtain_attributes_from_object
 SEARCH_TREE_DEPTH_LIMIT = 20
 
 
+def _run_scenario(
+    simulation: Type[Simulation], scenario: List[Any]
+) -> List[Operation]:
+    """
+    Runs a single Monte Carlo scenario. Defined at module level so that it
+    can be dispatched to worker processes.
+
+    Args:
+        simulation: Simulation class.
+        scenario: Input parameters of the simulation class instance.
+
+    Returns:
+        List of operations returned by the simulation.
+    """
+    return simulation(*scenario).run()
+
+
 @dataclass
 class MonteCarloParameter:
     """
@@ -196,15 +214,40 @@ class MonteCarloSimulation:
 
             search_tree = new_search_tree
 
-    def run(self) -> None:
+    def run(self, max_workers: Optional[int] = 1) -> None:
         """
         Executes the Monte Carlo simulation.
+
+        Scenarios are always generated in the calling process, so the random
+        draws do not depend on the number of workers. With more than one
+        worker, the scenarios are run in a process pool, which requires the
+        simulation class and the parameters to be picklable.
+
+        Args:
+            max_workers: Number of worker processes. If 1 (default), the
+                scenarios are run sequentially in the calling process. If
+                None, the number of processors of the machine is used.
         """
         self.results = []
+        scenarios = (
+            self.generate_scenario() for _ in range(self.number_of_scenarios)
+        )
 
-        for _ in range(self.number_of_scenarios):
-            scenario = self.generate_scenario()
-            self.results.append(self.simulation(*scenario).run())
+        if max_workers == 1:
+            self.results = [
+                _run_scenario(self.simulation, scenario)
+                for scenario in scenarios
+            ]
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            self.results = list(
+                executor.map(
+                    _run_scenario,
+                    itertools.repeat(self.simulation),
+                    scenarios,
+                )
+            )
 
     def retrieve_values_from_result(
         self,
@@ -251,6 +294,8 @@ class MonteCarloSimulation:
             **kwargs: Additional keyword arguments to pass to the histogram
                 plot.
         """
+        import plotly.graph_objects as go  # only needed for plotting
+
         values = self.retrieve_values_from_result(
             operation_index=operation_index, property=property
         )
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class Operation(ABC):
     """
@@ -31,3 +33,45 @@ class Operation(ABC):
         Prints some key values and metrics obtained from the operation.
         """
         pass
+
+    def __getstate__(self) -> dict:
+        """
+        Drops the append buffers when pickling, e.g. when an operation is
+        returned from a worker process. Only the filled part of each vector
+        is kept, and the buffers are rebuilt on the next append.
+        """
+        state = self.__dict__.copy()
+        state.pop("_buffers", None)
+        return state
+
+    def _append_values(self, **values: float) -> None:
+        """
+        Appends one value to each of the named vector attributes.
+
+        Each vector is backed by a float64 buffer that grows geometrically,
+        and the attribute is a view of the filled part of the buffer. This
+        makes appending amortized O(1), whereas np.append copies the whole
+        vector on every call. A buffer is rebuilt from the attribute if the
+        attribute was reassigned since the last append.
+
+        Args:
+            **values: The new value of each vector, keyed by attribute name.
+        """
+        buffers = self.__dict__.setdefault("_buffers", {})
+
+        for name, value in values.items():
+            vector = getattr(self, name)
+            size = vector.size
+            buffer = buffers.get(name)
+
+            if (
+                buffer is None
+                or vector.base is not buffer
+                or size == buffer.size
+            ):
+                buffer = np.empty(max(2 * size, 64), dtype=np.float64)
+                buffer[:size] = vector
+                buffers[name] = buffer
+
+            buffer[size] = value
+            setattr(self, name, buffer[: size + 1])
@@ -6,7 +6,50 @@ from . import BallisticOperation
 from machwave.models.atmosphere import Atmosphere
 from machwave.models.rocket import Rocket
 from machwave.services.equations import ballistics_ode
-from machwave.solvers.odes import rk4th_ode_solver
+
+
+def solve_ballistics_rk4(
+    y: float, v: float, d_t: float, T: float, D: float, M: float, g: float
+) -> tuple[float, float, float]:
+    """
+    Advances the 1 DOF ballistics equations by one 4th order Runge-Kutta
+    step.
+
+    The stages are written out explicitly for the two state variables,
+    which avoids rebuilding keyword dictionaries on every stage like the
+    generic solver does. Since the step is pure arithmetic, every argument
+    may also be a NumPy array, advancing a batch of independent trajectories
+    in a single vectorized call (e.g. for dispersion analysis).
+
+    Args:
+        y (float): Elevation at the beginning of the step.
+        v (float): Velocity at the beginning of the step.
+        d_t (float): The time step.
+        T (float): Thrust.
+        D (float): Drag constant (Cd * A * rho / 2).
+        M (float): Total mass of the vehicle.
+        g (float): Acceleration of gravity.
+
+    Returns:
+        tuple[float, float, float]: New elevation, new velocity and the
+        RK4-weighted acceleration over the step.
+    """
+    dy_1, dv_1 = ballistics_ode(y, v, T, D, M, g)
+    dy_2, dv_2 = ballistics_ode(
+        y + 0.5 * dy_1 * d_t, v + 0.5 * dv_1 * d_t, T, D, M, g
+    )
+    dy_3, dv_3 = ballistics_ode(
+        y + 0.5 * dy_2 * d_t, v + 0.5 * dv_2 * d_t, T, D, M, g
+    )
+    dy_4, dv_4 = ballistics_ode(y + dy_3 * d_t, v + dv_3 * d_t, T, D, M, g)
+
+    acceleration = (1 / 6) * (dv_1 + 2 * (dv_2 + dv_3) + dv_4)
+
+    return (
+        y + (1 / 6) * (dy_1 + 2 * (dy_2 + dy_3) + dy_4) * d_t,
+        v + acceleration * d_t,
+        acceleration,
+    )
 
 
 class Ballistic1DOperation(BallisticOperation):
@@ -40,15 +83,12 @@ class Ballistic1DOperation(BallisticOperation):
 
         self.t = np.array([0])  # time vector
 
-        self.P_ext = np.array(
-            [self.atmosphere.get_pressure(initial_elevation_amsl)]
-        )  # external pressure
-        self.rho_air = np.array(
-            [self.atmosphere.get_density(initial_elevation_amsl)]
-        )  # air density
-        self.g = np.array(
-            [self.atmosphere.get_gravity(initial_elevation_amsl)]
-        )  # acceleration of gravity
+        rho_air, P_ext, g, _ = self.atmosphere.get_properties(
+            initial_elevation_amsl
+        )
+        self.P_ext = np.array([P_ext])  # external pressure
+        self.rho_air = np.array([rho_air])  # air density
+        self.g = np.array([g])  # acceleration of gravity
         self.vehicle_mass = np.array(
             [initial_vehicle_mass]
         )  # total mass of the vehicle
@@ -59,6 +99,15 @@ class Ballistic1DOperation(BallisticOperation):
         self.acceleration = np.array([0])  # acceleration
         self.mach_no = np.array([0])  # Mach number
 
+        # Latest altitude as a plain scalar, so that simulation loops can
+        # test it without indexing the altitude vector on every step:
+        self.y_last = 0.0
+
+        # Air density and gravity at the latest altitude, used at the
+        # beginning of the next step:
+        self._rho_air_last = rho_air
+        self._g_last = g
+
         self.velocity_out_of_rail = None
 
     @property
@@ -86,7 +135,7 @@ class Ballistic1DOperation(BallisticOperation):
         propellant_mass: float,
         thrust: float,
         d_t: float,
-    ) -> None:
+    ) -> float:
         """
         Perform an iteration of the ballistics operation.
 
@@ -94,26 +143,22 @@ class Ballistic1DOperation(BallisticOperation):
             propellant_mass (float): The mass of the propellant.
             thrust (float): The thrust force.
             d_t (float): The time step.
-        """
-        self.t = np.append(self.t, self.t[-1] + d_t)  # append new time value
-
-        self.rho_air = np.append(
-            self.rho_air,
-            self.atmosphere.get_density(
-                y_amsl=(self.y[-1] + self.initial_elevation_amsl)
-            ),
-        )
-        self.g = np.append(
-            self.g,
-            self.atmosphere.get_gravity(
-                self.initial_elevation_amsl + self.y[-1]
-            ),
-        )
 
-        # Appending the current vehicle mass, consisting of the motor
-        # structural mass, mass without the motor, and propellant mass.
-        self.vehicle_mass = np.append(
-            self.vehicle_mass, propellant_mass + self.rocket.get_dry_mass()
+        Returns:
+            float: The external pressure at the new altitude.
+        """
+        rho_air = self._rho_air_last
+        g = self._g_last
+
+        # Appending the new time value and the current vehicle mass,
+        # consisting of the motor structural mass, mass without the motor,
+        # and propellant mass.
+        vehicle_mass = propellant_mass + self.rocket.get_dry_mass()
+        self._append_values(
+            t=self.t[-1] + d_t,
+            rho_air=rho_air,
+            g=g,
+            vehicle_mass=vehicle_mass,
         )
 
         # Drag properties:
@@ -134,64 +179,64 @@ class Ballistic1DOperation(BallisticOperation):
                 fuselage_area * fuselage_drag_coeff
                 + recovery_area * recovery_drag_coeff
             )
-            * self.rho_air[-1]
+            * rho_air
             * 0.5
         )
 
-        ballistics_results = rk4th_ode_solver(
-            variables={"y": self.y[-1], "v": self.v[-1]},
-            equation=ballistics_ode,
+        height, velocity, acceleration = solve_ballistics_rk4(
+            y=self.y[-1],
+            v=self.v[-1],
             d_t=d_t,
             T=thrust,
             D=D,
-            M=self.vehicle_mass[-1],
-            g=self.g[-1],
+            M=vehicle_mass,
+            g=g,
         )
 
-        height = ballistics_results[0]
-        velocity = ballistics_results[1]
-        acceleration = ballistics_results[2]
-
         if height < 0 and len(self.y[self.y > 0]) == 0:
             height = 0
             velocity = 0
             acceleration = 0
 
-        self.y = np.append(self.y, height)
-        self.v = np.append(self.v, velocity)
-        self.acceleration = np.append(self.acceleration, acceleration)
-
-        self.mach_no = np.append(
-            self.mach_no,
-            self.v[-1]
-            / self.atmosphere.get_sonic_velocity(
-                self.y[-1] + self.initial_elevation_amsl
-            ),
+        # All atmosphere properties at the new altitude, in a single query:
+        rho_air_new, P_ext, g_new, sonic_velocity = (
+            self.atmosphere.get_properties(
+                height + self.initial_elevation_amsl
+            )
         )
 
-        self.P_ext = np.append(
-            self.P_ext,
-            self.atmosphere.get_pressure(
-                self.y[-1] + self.initial_elevation_amsl
-            ),
+        self._append_values(
+            y=height,
+            v=velocity,
+            acceleration=acceleration,
+            mach_no=velocity / sonic_velocity,
+            P_ext=P_ext,
         )
+        self.y_last = height
+        self._rho_air_last = rho_air_new
+        self._g_last = g_new
 
         if self.velocity_out_of_rail is None and self.y[-1] > self.rail_length:
             self.velocity_out_of_rail = self.v[-2]
 
+        return P_ext
+
     def print_results(self) -> None:
         """
         Print the results of the ballistics operation.
         """
-        print("\nROCKET BALLISTICS")
-
-        print(f" Apogee: {np.max(self.y):.2f} m")
-        print(f" Max. velocity: {np.max(self.v):.2f} m/s")
-        print(f" Max. Mach number: {np.max(self.mach_no):.3f}")
-        print(f" Max. acceleration: {np.max(self.acceleration) / 9.81:.2f} gs")
-        print(f" Time to apogee: {self.apogee_time:.2f} s")
-        print(
-            f" Velocity out of the rail: {self.velocity_out_of_rail:.2f} m/s"
-        )
-        print(f" Liftoff mass: {self.vehicle_mass[0]:.3f} kg")
-        print(f" Flight time: {self.t[-1]:.2f} s")
+        lines = [
+            "\nROCKET BALLISTICS",
+            f" Apogee: {np.max(self.y):.2f} m",
+            f" Max. velocity: {np.max(self.v):.2f} m/s",
+            f" Max. Mach number: {np.max(self.mach_no):.3f}",
+            " Max. acceleration: "
+            f"{np.max(self.acceleration) / 9.81:.2f} gs",
+            f" Time to apogee: {self.apogee_time:.2f} s",
+            " Velocity out of the rail: "
+            f"{self.velocity_out_of_rail:.2f} m/s",
+            f" Liftoff mass: {self.vehicle_mass[0]:.3f} kg",
+            f" Flight time: {self.t[-1]:.2f} s",
+        ]
+
+        print("\n".join(lines))
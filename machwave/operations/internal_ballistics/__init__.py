@@ -1,11 +1,10 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
 from machwave.operations import Operation
-from machwave.solvers.odes import rk4th_ode_solver
-from machwave.services.equations import solve_cp_seidel
+from machwave.services.equations import make_seidel_rhs
 from machwave.models.propulsion import Motor, SolidMotor
 from machwave.services.isentropic_flow import (
     get_critical_pressure_ratio,
@@ -68,7 +67,7 @@ class MotorOperation(Operation):
         self.end_burn = False
 
     @abstractmethod
-    def iterate(self) -> None:
+    def iterate(self) -> tuple[float, float]:
         """
         Calculates and stores operational parameters in the corresponding
         vectors.
@@ -79,6 +78,11 @@ class MotorOperation(Operation):
 
         When executed, the method must increment the necessary attributes
         according to a differential property (time, distance or other).
+
+        Returns:
+            tuple[float, float]: The propellant mass and thrust computed in
+            this iteration, so that callers do not have to index the stored
+            vectors.
         """
         pass
 
@@ -156,11 +160,50 @@ class SRMOperation(MotorOperation):
         self.n_tp = np.array([0])  # two-phase flow correction factor
         self.n_cf = np.array([0])  # thrust coefficient correction factor
 
+        # Motor properties that remain constant during the operation. They
+        # are evaluated once here instead of on every iteration:
+        self._throat_area = self.motor.structure.nozzle.get_throat_area()
+        self._critical_pressure_ratio = get_critical_pressure_ratio(
+            self.motor.propellant.k_mix_ch
+        )
+        self._divergent_correction_factor = (
+            self.motor.structure.nozzle.get_divergent_correction_factor()
+        )
+        self._seidel_rhs = self._make_seidel_rhs()
+
+    def __getstate__(self) -> dict:
+        """
+        Drops the Seidel closure when pickling, since local functions cannot
+        be pickled. It is rebuilt from the motor on unpickling.
+        """
+        state = super().__getstate__()
+        state.pop("_seidel_rhs", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._seidel_rhs = self._make_seidel_rhs()
+
+    def _make_seidel_rhs(self) -> Callable[..., float]:
+        """
+        Returns:
+            Callable[..., float]: The Seidel equation specialized for the
+                nozzle throat and propellant of the motor.
+        """
+        return make_seidel_rhs(
+            self._throat_area,
+            self.motor.propellant.density,
+            self.motor.propellant.k_mix_ch,
+            self.motor.propellant.R_ch,
+            self.motor.propellant.T0,
+            self._critical_pressure_ratio,
+        )
+
     def iterate(
         self,
         d_t: float,
         P_ext: float,
-    ) -> None:
+    ) -> tuple[float, float]:
         """
         Iterate the motor operation by calculating and storing operational
         parameters in the corresponding vectors.
@@ -168,171 +211,173 @@ class SRMOperation(MotorOperation):
         Args:
             d_t (float): The time increment.
             P_ext (float): The external pressure.
+
+        Returns:
+            tuple[float, float]: The latest propellant mass and thrust.
         """
         if not self.end_thrust:
-            self.t = np.append(
-                self.t, self.t[-1] + d_t
-            )  # append new time value
+            # Models used on every step, bound once so that the attribute
+            # chains are not resolved repeatedly below:
+            motor = self.motor
+            grain = motor.grain
+            propellant = motor.propellant
+            nozzle = motor.structure.nozzle
 
-            self.burn_area = np.append(
-                self.burn_area, self.motor.grain.get_burn_area(self.web[-1])
-            )
-            self.propellant_volume = np.append(
-                self.propellant_volume,
-                self.motor.grain.get_propellant_volume(self.web[-1]),
-            )
+            t = self.t[-1] + d_t  # new time value
+
+            web = self.web[-1]
+            burn_area = grain.get_burn_area(web)
+            propellant_volume = grain.get_propellant_volume(web)
 
             # Calculating the free chamber volume:
-            self.V_0 = np.append(
-                self.V_0,
-                self.motor.get_free_chamber_volume(self.propellant_volume[-1]),
-            )
+            chamber_volume = motor.get_free_chamber_volume(propellant_volume)
             # Calculating propellant mass:
-            self.m_prop = np.append(
-                self.m_prop,
-                self.propellant_volume[-1] * self.motor.propellant.density,
-            )
+            density = propellant.density
+            m_prop = propellant_volume * density
 
             # Get burn rate coefficients:
-            self.burn_rate = np.append(
-                self.burn_rate,
-                self.motor.propellant.get_burn_rate(self.P_0[-1]),
-            )
-
-            d_x = d_t * self.burn_rate[-1]
-            self.web = np.append(self.web, self.web[-1] + d_x)
-
-            self.P_0 = np.append(
-                self.P_0,
-                rk4th_ode_solver(
-                    variables={"P0": self.P_0[-1]},
-                    equation=solve_cp_seidel,
-                    d_t=d_t,
-                    Pe=P_ext,
-                    Ab=self.burn_area[-1],
-                    V0=self.V_0[-1],
-                    At=self.motor.structure.nozzle.get_throat_area(),
-                    pp=self.motor.propellant.density,
-                    k=self.motor.propellant.k_mix_ch,
-                    R=self.motor.propellant.R_ch,
-                    T0=self.motor.propellant.T0,
-                    r=self.burn_rate[-1],
-                )[0],
-            )
-
-            self.P_exit = np.append(
-                self.P_exit,
-                get_exit_pressure(
-                    self.motor.propellant.k_2ph_ex,
-                    self.motor.structure.nozzle.expansion_ratio,
-                    self.P_0[-1],
-                ),
-            )
+            P_0_previous = self.P_0[-1]
+            burn_rate = propellant.get_burn_rate(P_0_previous)
+
+            d_x = d_t * burn_rate
+
+            # Chamber pressure ODE, integrated with an explicit 4th order
+            # Runge-Kutta step. Every argument except the chamber pressure
+            # is constant over the time step, so they are bound once in a
+            # closure instead of being passed on each of the four stages:
+            throat_area = self._throat_area
+            critical_pressure_ratio = self._critical_pressure_ratio
+            seidel_rhs = self._seidel_rhs
+
+            def get_pressure_derivative(P: float) -> float:
+                return seidel_rhs(
+                    P, P_ext, burn_area, chamber_volume, burn_rate
+                )
+
+            k_1 = get_pressure_derivative(P_0_previous)
+            k_2 = get_pressure_derivative(P_0_previous + 0.5 * k_1 * d_t)
+            k_3 = get_pressure_derivative(P_0_previous + 0.5 * k_2 * d_t)
+            k_4 = get_pressure_derivative(P_0_previous + k_3 * d_t)
+            P_0 = P_0_previous + (1 / 6) * (k_1 + 2 * (k_2 + k_3) + k_4) * d_t
+
+            k_2ph_ex = propellant.k_2ph_ex
+            expansion_ratio = nozzle.expansion_ratio
+            P_exit = get_exit_pressure(k_2ph_ex, expansion_ratio, P_0)
 
             (
                 n_kin_atual,
                 n_tp_atual,
                 n_bl_atual,
             ) = get_operational_correction_factors(
-                self.P_0[-1],
+                P_0,
                 P_ext,
-                convert_pa_to_psi(self.P_0[-1]),
-                self.motor.propellant,
-                self.motor.structure,
-                get_critical_pressure_ratio(self.motor.propellant.k_mix_ch),
+                convert_pa_to_psi(P_0),
+                propellant,
+                motor.structure,
+                critical_pressure_ratio,
                 self.V_0[0],
-                self.t[-1],
+                t,
             )
 
-            self.n_kin = np.append(self.n_kin, n_kin_atual)
-            self.n_tp = np.append(self.n_tp, n_tp_atual)
-            self.n_bl = np.append(self.n_bl, n_bl_atual)
-
-            self.n_cf = np.append(
-                self.n_cf,
-                (
-                    (100 - (n_kin_atual + n_bl_atual + n_tp_atual))
-                    * self.motor.structure.nozzle.get_divergent_correction_factor()
-                    / 100
-                    * self.motor.propellant.combustion_efficiency
-                ),
+            n_cf = (
+                (100 - (n_kin_atual + n_bl_atual + n_tp_atual))
+                * self._divergent_correction_factor
+                / 100
+                * propellant.combustion_efficiency
             )
 
             C_f_atual, C_f_ideal_atual = get_thrust_coefficients(
-                self.P_0[-1],
-                self.P_exit[-1],
+                P_0,
+                P_exit,
                 P_ext,
-                self.motor.structure.nozzle.expansion_ratio,
-                self.motor.propellant.k_2ph_ex,
-                self.n_cf[-1],
+                expansion_ratio,
+                k_2ph_ex,
+                n_cf,
             )
 
-            self.C_f = np.append(self.C_f, C_f_atual)
-            self.C_f_ideal = np.append(self.C_f_ideal, C_f_ideal_atual)
-            self.thrust = np.append(
-                self.thrust,
-                get_thrust_from_cf(
-                    self.C_f[-1],
-                    self.P_0[-1],
-                    self.motor.structure.nozzle.get_throat_area(),
-                ),
+            thrust = get_thrust_from_cf(
+                C_f_atual,
+                P_0,
+                throat_area,
             )  # thrust calculation
 
-            if self.m_prop[-1] == 0 and not self.end_burn:
-                self.burn_time = self.t[-1]
+            self._append_values(
+                t=t,
+                burn_area=burn_area,
+                propellant_volume=propellant_volume,
+                V_0=chamber_volume,
+                m_prop=m_prop,
+                burn_rate=burn_rate,
+                web=web + d_x,
+                P_0=P_0,
+                P_exit=P_exit,
+                n_kin=n_kin_atual,
+                n_tp=n_tp_atual,
+                n_bl=n_bl_atual,
+                n_cf=n_cf,
+                C_f=C_f_atual,
+                C_f_ideal=C_f_ideal_atual,
+                thrust=thrust,
+            )
+
+            if m_prop == 0 and not self.end_burn:
+                self.burn_time = t
                 self.end_burn = True
 
             # This if statement changes 'end_thrust' to True if supersonic
             # flow is not achieved anymore.
-            if not is_flow_choked(
-                self.P_0[-1],
-                P_ext,
-                get_critical_pressure_ratio(self.motor.propellant.k_mix_ch),
-            ):
-                self._thrust_time = self.t[-1]
+            if not is_flow_choked(P_0, P_ext, critical_pressure_ratio):
+                self._thrust_time = t
                 self.end_thrust = True
 
+            return m_prop, thrust
+
+        return self.m_prop[-1], self.thrust[-1]
+
     def print_results(self) -> None:
         """
         Prints the results obtained during the SRM operation.
         """
-        print("\nBURN REGRESSION")
+        klemmung = self.klemmung
+        max_mass_flux = self.max_mass_flux
+
         if self.m_prop[0] > 1:
-            print(f" Propellant initial mass {self.m_prop[0]:.3f} kg")
+            initial_mass = f" Propellant initial mass {self.m_prop[0]:.3f} kg"
         else:
-            print(f" Propellant initial mass {self.m_prop[0] * 1e3:.3f} g")
-        print(" Mean Kn: %.2f" % np.mean(self.klemmung))
-        print(" Max Kn: %.2f" % np.max(self.klemmung))
-        print(
-            f" Initial to final Kn ratio: {self.initial_to_final_klemmung_ratio:.3f}"
-        )
-        print(f" Volumetric efficiency: {self.volumetric_efficiency:.3%}")
-        print(" Burn profile: " + self.burn_profile)
-        print(
-            f" Max initial mass flux: {self.max_mass_flux:.3f} kg/s-m-m or "
-            f"{convert_mass_flux_metric_to_imperial(self.max_mass_flux):.3f} "
-            "lb/s-in-in"
-        )
-
-        print("\nCHAMBER PRESSURE")
-        print(
-            f" Maximum, average chamber pressure: {np.max(self.P_0) * 1e-6:.3f}, "
-            f"{np.mean(self.P_0) * 1e-6:.3f} MPa"
-        )
-
-        print("\nTHRUST AND IMPULSE")
-        print(
-            f" Maximum, average thrust: {np.max(self.thrust):.3f}, {np.mean(self.thrust):.3f} N"
-        )
-        print(
-            f" Total, specific impulses: {self.total_impulse:.3f} N-s, {self.specific_impulse:.3f} s"
-        )
-        print(
-            f" Burnout time, thrust time: {self.burn_time:.3f}, {self.thrust_time:.3f} s"
-        )
+            initial_mass = (
+                f" Propellant initial mass {self.m_prop[0] * 1e3:.3f} g"
+            )
 
-        print("\nNOZZLE DESIGN")
-        print(f" Average nozzle efficiency: {np.mean(self.n_cf):.3%}")
+        # The report is assembled first and written with a single print
+        # call, instead of one call (and flush) per line:
+        lines = [
+            "\nBURN REGRESSION",
+            initial_mass,
+            f" Mean Kn: {np.mean(klemmung):.2f}",
+            f" Max Kn: {np.max(klemmung):.2f}",
+            " Initial to final Kn ratio: "
+            f"{self.initial_to_final_klemmung_ratio:.3f}",
+            f" Volumetric efficiency: {self.volumetric_efficiency:.3%}",
+            " Burn profile: " + self.burn_profile,
+            f" Max initial mass flux: {max_mass_flux:.3f} kg/s-m-m or "
+            f"{convert_mass_flux_metric_to_imperial(max_mass_flux):.3f} "
+            "lb/s-in-in",
+            "\nCHAMBER PRESSURE",
+            " Maximum, average chamber pressure: "
+            f"{np.max(self.P_0) * 1e-6:.3f}, "
+            f"{np.mean(self.P_0) * 1e-6:.3f} MPa",
+            "\nTHRUST AND IMPULSE",
+            f" Maximum, average thrust: {np.max(self.thrust):.3f}, "
+            f"{np.mean(self.thrust):.3f} N",
+            f" Total, specific impulses: {self.total_impulse:.3f} N-s, "
+            f"{self.specific_impulse:.3f} s",
+            f" Burnout time, thrust time: {self.burn_time:.3f}, "
+            f"{self.thrust_time:.3f} s",
+            "\nNOZZLE DESIGN",
+            f" Average nozzle efficiency: {np.mean(self.n_cf):.3%}",
+        ]
+
+        print("\n".join(lines))
 
     @property
     def klemmung(self) -> np.ndarray:
@@ -1,53 +1,71 @@
-def convert_pa_to_psi(pressure_pa: float) -> float:
+from typing import Union
+
+import numpy as np
+
+PA_TO_PSI = 1.45e-4
+PA_TO_MPA = 1e-6
+MPA_TO_PA = 1e6
+MASS_FLUX_METRIC_TO_IMPERIAL = 1.42233e-3
+
+
+def convert_pa_to_psi(
+    pressure_pa: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Converts Pascal pressure to PSI.
 
     Args:
-        pressure_pa (float): Pressure in Pascal.
+        pressure_pa (Union[float, np.ndarray]): Pressure in Pascal.
 
     Returns:
-        float: Pressure in PSI.
+        Union[float, np.ndarray]: Pressure in PSI.
     """
-    return pressure_pa * 1.45e-4
+    return pressure_pa * PA_TO_PSI
 
 
-def convert_pa_to_mpa(pressure_pa: float) -> float:
+def convert_pa_to_mpa(
+    pressure_pa: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Converts Pascal pressure to MPa.
 
     Args:
-        pressure_pa (float): Pressure in Pascal.
+        pressure_pa (Union[float, np.ndarray]): Pressure in Pascal.
 
     Returns:
-        float: Pressure in MPa.
+        Union[float, np.ndarray]: Pressure in MPa.
     """
-    return pressure_pa * 1e-6
+    return pressure_pa * PA_TO_MPA
 
 
-def convert_mpa_to_pa(pressure_mpa: float) -> float:
+def convert_mpa_to_pa(
+    pressure_mpa: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Converts MPa pressure to Pascal.
 
     Args:
-        pressure_mpa (float): Pressure in MPa.
+        pressure_mpa (Union[float, np.ndarray]): Pressure in MPa.
 
     Returns:
-        float: Pressure in Pascal.
+        Union[float, np.ndarray]: Pressure in Pascal.
     """
-    return pressure_mpa / 1e-6
+    return pressure_mpa * MPA_TO_PA
 
 
-def convert_mass_flux_metric_to_imperial(mass_flux_metric: float) -> float:
+def convert_mass_flux_metric_to_imperial(
+    mass_flux_metric: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Converts a mass flux in kg/s-m-m to lb/s-in-in.
 
     Args:
-        mass_flux_metric (float): Mass flux in kg/s-m-m.
+        mass_flux_metric (Union[float, np.ndarray]): Mass flux in kg/s-m-m.
 
     Returns:
-        float: Mass flux in lb/s-in-in.
+        Union[float, np.ndarray]: Mass flux in lb/s-in-in.
     """
-    return mass_flux_metric * 1.42233e-3
+    return mass_flux_metric * MASS_FLUX_METRIC_TO_IMPERIAL
 
 
 def convert_burn_rate_coefficient_to_metric(
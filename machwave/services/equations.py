@@ -1,6 +1,5 @@
-from typing import Tuple
-
-from machwave.services.isentropic_flow import get_critical_pressure_ratio
+import math
+from typing import Callable, Optional, Tuple
 
 
 def solve_cp_seidel(
@@ -14,6 +13,7 @@ def solve_cp_seidel(
     R: float,
     T0: float,
     r: float,
+    critical_pressure_ratio: Optional[float] = None,
 ) -> Tuple[float]:
     """
     Calculates the chamber pressure by solving Hans Seidel's differential
@@ -34,25 +34,88 @@ def solve_cp_seidel(
         R (float): Gas constant per molecular weight.
         T0 (float): Flame temperature.
         r (float): Propellant burn rate.
+        critical_pressure_ratio (float, optional): Critical pressure ratio of
+            the mix. Computed from k if not provided.
 
     Returns:
         Tuple[float]: Derivative of chamber pressure with respect to time.
 
+    Raises:
+        ValueError: If the external pressure is higher than the chamber
+            pressure, since the nozzle flow is then undefined.
+
     """
-    critical_pressure_ratio = get_critical_pressure_ratio(k_mix_ch=k)
+    seidel_rhs = make_seidel_rhs(At, pp, k, R, T0, critical_pressure_ratio)
+    return (seidel_rhs(P0, Pe, Ab, V0, r),)
 
-    if Pe / P0 <= critical_pressure_ratio:
-        H = ((k / (k + 1)) ** 0.5) * ((2 / (k + 1)) ** (1 / (k - 1)))
-    else:
-        H = ((Pe / P0) ** (1 / k)) * (
-            ((k / (k - 1)) * (1 - (Pe / P0) ** ((k - 1) / k))) ** 0.5
-        )
 
-    dP0_dt = (
-        (R * T0 * Ab * pp * r) - (P0 * At * H * ((2 * R * T0) ** 0.5))
-    ) / V0
+def make_seidel_rhs(
+    At: float,
+    pp: float,
+    k: float,
+    R: float,
+    T0: float,
+    critical_pressure_ratio: Optional[float] = None,
+) -> Callable[[float, float, float, float, float], float]:
+    """
+    Specializes Hans Seidel's chamber pressure differential equation (see
+    solve_cp_seidel) for a motor whose nozzle throat, propellant density and
+    combustion gas properties are constant during the burn.
 
-    return (dP0_dt,)
+    Every term that only depends on those constants, including the whole
+    choked flow coefficient, is evaluated once here instead of on every call
+    of the returned function.
+
+    Args:
+        At (float): Nozzle throat area.
+        pp (float): Propellant density.
+        k (float): Isentropic exponent of the mix.
+        R (float): Gas constant per molecular weight.
+        T0 (float): Flame temperature.
+        critical_pressure_ratio (float, optional): Critical pressure ratio of
+            the mix. Computed from k if not provided.
+
+    Returns:
+        Callable[[float, float, float, float, float], float]: Function of the
+        chamber pressure, external pressure, burn area, chamber free volume
+        and burn rate, in this order, that returns the derivative of chamber
+        pressure with respect to time. Like solve_cp_seidel, it raises
+        ValueError if the external pressure is higher than the chamber
+        pressure.
+
+    """
+    if critical_pressure_ratio is None:
+        critical_pressure_ratio = (2 / (k + 1)) ** (k / (k - 1))
+
+    RT0_pp = R * T0 * pp
+    At_sqrt_2RT0 = At * math.sqrt(2 * R * T0)
+    At_H_choked = (
+        At_sqrt_2RT0
+        * math.sqrt(k / (k + 1))
+        * ((2 / (k + 1)) ** (1 / (k - 1)))
+    )
+    inverse_k = 1 / k
+    k_minus_1_over_k = (k - 1) / k
+    k_over_k_minus_1 = k / (k - 1)
+
+    def seidel_rhs(
+        P0: float, Pe: float, Ab: float, V0: float, r: float
+    ) -> float:
+        pressure_ratio = Pe / P0
+
+        if pressure_ratio <= critical_pressure_ratio:
+            At_H = At_H_choked
+        else:
+            At_H = At_sqrt_2RT0 * (
+                (pressure_ratio**inverse_k)
+                * math.sqrt(
+                    k_over_k_minus_1 * (1 - pressure_ratio**k_minus_1_over_k)
+                )
+            )
+
+        return (RT0_pp * Ab * r - P0 * At_H) / V0
+
+    return seidel_rhs
 
 
 def ballistics_ode(
@@ -61,6 +124,10 @@ def ballistics_ode(
     """
     Returns the derivatives of elevation and velocity.
 
+    All arguments may also be NumPy arrays of the same shape (or scalars
+    that broadcast against them), in which case each element is treated as
+    an independent trajectory.
+
     Args:
         y (float): Instant elevation.
         v (float): Instant velocity.
@@ -72,12 +139,10 @@ def ballistics_ode(
     Returns:
         Tuple[float, float]: Derivatives of elevation and velocity.
     """
-    if v < 0:
-        x = -1
-    else:
-        x = 1
-
-    dv_dt = (T - x * D * (v**2)) / M - g
+    # Drag always opposes the velocity, hence v * |v| instead of v ** 2.
+    # Written without branches so that the function also accepts NumPy
+    # arrays, e.g. to integrate many independent trajectories at once.
+    dv_dt = (T - D * (v * abs(v))) / M - g
     dy_dt = v
 
     return (dy_dt, dv_dt)
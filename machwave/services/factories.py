@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from machwave.models.propulsion import Motor, SolidMotor
 from machwave.operations.internal_ballistics import (
     MotorOperation,
@@ -5,15 +7,41 @@ from machwave.operations.internal_ballistics import (
 )
 
 
-def get_motor_operation_class(motor: Motor) -> MotorOperation:
+@lru_cache(maxsize=None)
+def _get_motor_operation_class(
+    motor_class: type[Motor],
+) -> type[MotorOperation]:
+    """
+    Memoized lookup of the motor operation class for a motor class.
+
+    Args:
+        motor_class (type[Motor]): The class of the motor object.
+
+    Returns:
+        type[MotorOperation]: The motor operation class.
+
+    Raises:
+        ValueError: If the motor type is not supported.
+    """
+    if issubclass(motor_class, SolidMotor):
+        return SRMOperation
+    else:
+        raise ValueError("Unsupported motor type.")
+
+
+def get_motor_operation_class(motor: Motor) -> type[MotorOperation]:
     """
     Returns the appropriate motor operation class based on the type of motor.
 
+    The lookup is memoized per motor class, so repeated calls (e.g. from
+    Monte Carlo drivers that instantiate many simulations) are a single
+    dictionary access.
+
     Args:
         motor (Motor): The motor object.
 
     Returns:
-        MotorOperation: The motor operation class.
+        type[MotorOperation]: The motor operation class.
 
     Raises:
         ValueError: If the motor type is not supported.
@@ -22,7 +50,4 @@ def get_motor_operation_class(motor: Motor) -> MotorOperation:
         motor = SolidMotor(...)
         motor_operation_class = get_motor_operation_class(motor)
     """
-    if isinstance(motor, SolidMotor):
-        return SRMOperation
-    else:
-        raise ValueError("Unsupported motor type.")
+    return _get_motor_operation_class(type(motor))
@@ -1,8 +1,38 @@
+from functools import lru_cache
+import math
+from typing import Union
+
 import numpy as np
-import scipy.optimize
 
 from machwave.services.math.geometric import get_circle_area
 
+# Convergence criteria of the exit Mach number iterations, the tolerance
+# being on the relative change of the Mach number:
+_EXIT_MACH_TOLERANCE = 1e-13
+_EXIT_MACH_MAX_ITERATIONS = 50
+
+# Coefficients (C3, C4, C5, C6) of the two-phase flow loss correlation
+# (A015140). The first index is 0 if 1 / M_ch >= 0.9 and 1 otherwise. The
+# second index is the size bin: throat diameter below 1 in, between 1 in
+# and 2 in, and for throats of 2 in or more, C7 < 4, 4 <= C7 <= 8 and
+# C7 > 8.
+_TWO_PHASE_FLOW_COEFFICIENTS = (
+    (
+        (9, 0.5, 1, 1),
+        (9, 0.5, 1, 0.8),
+        (13.4, 0.5, 0.8, 0.8),
+        (10.2, 0.5, 0.8, 0.4),
+        (7.58, 0.5, 0.8, 0.33),
+    ),
+    (
+        (44.5, 1, 0.8, 0.8),
+        (30.4, 1, 0.8, 0.4),
+        (44.5, 1, 0.8, 0.8),
+        (30.4, 1, 0.8, 0.4),
+        (25.2, 1, 0.8, 0.33),
+    ),
+)
+
 
 def get_critical_pressure_ratio(k_mix_ch: float) -> float:
     """
@@ -20,35 +50,58 @@ def get_critical_pressure_ratio(k_mix_ch: float) -> float:
     return (2 / (k_mix_ch + 1)) ** (k_mix_ch / (k_mix_ch - 1))
 
 
-def get_opt_expansion_ratio(k: float, P_0: float, P_ext: float) -> float:
+def get_opt_expansion_ratio(
+    k: float, P_0: Union[float, np.ndarray], P_ext: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Returns the optimal expansion ratio based on the current chamber pressure,
     specific heat ratio, and external pressure.
 
+    The pressures may also be arrays (e.g. the chamber pressure over a whole
+    operation), in which case the optimal expansion ratio of every element
+    is computed in a single vectorized pass.
+
     Args:
         k (float): The isentropic exponent.
-        P_0 (float): The chamber pressure.
-        P_ext (float): The external pressure.
+        P_0 (float | np.ndarray): The chamber pressure.
+        P_ext (float | np.ndarray): The external pressure.
 
     Returns:
-        float: The optimal expansion ratio.
+        float | np.ndarray: The optimal expansion ratio, with the broadcast
+        shape of the pressures.
 
     Example:
         expansion_ratio = get_opt_expansion_ratio(1.4, 100000, 10000)
     """
+    pressure_ratio = np.asarray(P_ext, dtype=np.float64) / np.asarray(
+        P_0, dtype=np.float64
+    )
+
     exp_opt = (
         (((k + 1) / 2) ** (1 / (k - 1)))
-        * ((P_ext / P_0) ** (1 / k))
-        * np.sqrt(((k + 1) / (k - 1)) * (1 - (P_ext / P_0) ** ((k - 1) / k)))
+        * (pressure_ratio ** (1 / k))
+        * np.sqrt(((k + 1) / (k - 1)) * (1 - pressure_ratio ** ((k - 1) / k)))
     ) ** -1
 
     return exp_opt
 
 
+@lru_cache(maxsize=256)
 def get_exit_mach(k: float, E: float) -> float:
     """
     Calculates the exit Mach number of the nozzle flow.
 
+    The supersonic root of the isentropic area-Mach relation is found with
+    Newton's method, applied to the logarithm of the relation as a function
+    of log(M). Both sides are close to linear there, and the derivative is
+    analytic, so the solution takes a handful of iterations. The initial
+    guess is taken from the large Mach number asymptote of the relation.
+
+    The root only depends on (k, E), which are usually fixed for a whole
+    simulation (e.g. the exit pressure is evaluated on every time step
+    for the same nozzle), so results are memoized and repeated calls
+    return the converged value directly.
+
     Args:
         k (float): The isentropic exponent.
         E (float): The expansion ratio.
@@ -56,19 +109,36 @@ def get_exit_mach(k: float, E: float) -> float:
     Returns:
         float: The exit Mach number.
 
+    Raises:
+        ValueError: If the expansion ratio is not greater than 1, or if the
+            iterations do not converge.
+
     Example:
         exit_mach = get_exit_mach(1.4, 5.0)
     """
-    exit_mach_no = scipy.optimize.fsolve(
-        lambda x: (
-            ((1 + 0.5 * (k - 1) * x**2) / (1 + 0.5 * (k - 1)))
-            ** ((k + 1) / (2 * (k - 1)))
+    if E <= 1:
+        raise ValueError("The expansion ratio must be greater than 1.")
+
+    a = 0.5 * (k - 1)
+    b = (k + 1) / (2 * (k - 1))
+    log_E = math.log(E)
+
+    M = (E * ((1 + a) / a) ** b) ** (1 / (2 * b - 1))
+
+    for _ in range(_EXIT_MACH_MAX_ITERATIONS):
+        M_squared = M * M
+        residual = (
+            b * math.log((1 + a * M_squared) / (1 + a)) - math.log(M) - log_E
         )
-        / x
-        - E,
-        [10],
-    )
-    return exit_mach_no[0]
+        # Newton step on log(M), the derivative of the residual with
+        # respect to log(M) being (M^2 - 1) / (1 + a * M^2):
+        step = residual * (1 + a * M_squared) / (M_squared - 1)
+        M *= math.exp(-step)
+
+        if abs(step) <= _EXIT_MACH_TOLERANCE:
+            return M
+
+    raise ValueError("The exit Mach number did not converge.")
 
 
 def get_exit_pressure(k_2ph_ex: float, E: float, P_0: float) -> float:
@@ -93,6 +163,26 @@ def get_exit_pressure(k_2ph_ex: float, E: float, P_0: float) -> float:
     return P_exit
 
 
+@lru_cache(maxsize=32)
+def _get_thrust_coefficient_constants(k: float) -> tuple[float, float, float]:
+    """
+    Returns the factors of the ideal thrust coefficient that only depend on
+    the isentropic exponent, see get_thrust_coefficients.
+
+    Args:
+        k (float): The isentropic exponent.
+
+    Returns:
+        tuple[float, float, float]: 2 k^2 / (k - 1),
+        (2 / (k + 1)) ^ ((k + 1) / (k - 1)) and (k - 1) / k.
+    """
+    return (
+        2 * (k**2) / (k - 1),
+        (2 / (k + 1)) ** ((k + 1) / (k - 1)),
+        (k - 1) / k,
+    )
+
+
 def get_thrust_coefficients(
     P_0: float,
     P_exit: float,
@@ -118,20 +208,18 @@ def get_thrust_coefficients(
     Example:
         Cf, Cf_ideal = get_thrust_coefficients(100000, 5000, 1000, 5.0, 1.4, 0.8)
     """
-    P_r = P_exit / P_0
-    Cf_ideal = np.sqrt(
-        (2 * (k**2) / (k - 1))
-        * ((2 / (k + 1)) ** ((k + 1) / (k - 1)))
-        * (1 - (P_r ** ((k - 1) / k)))
+    (
+        k_factor,
+        throat_factor,
+        exponent,
+    ) = _get_thrust_coefficient_constants(k)
+
+    Cf_ideal = math.sqrt(
+        k_factor * throat_factor * (1 - ((P_exit / P_0) ** exponent))
     )
     Cf = (Cf_ideal + E * (P_exit - P_external) / P_0) * n_cf
 
-    if Cf <= 0:
-        Cf = 0
-    if Cf_ideal <= 0:
-        Cf_ideal = 0
-
-    return Cf, Cf_ideal
+    return max(Cf, 0.0), max(Cf_ideal, 0.0)
 
 
 def get_thrust_from_cf(
@@ -278,19 +366,21 @@ def get_operational_correction_factors(
 
     # Boundary layer and two-phase flow losses
     if not is_flow_choked(P_0, P_external, critical_pressure_ratio):
-        termc_2 = 1 + 2 * np.exp(
-            -structure.nozzle.material.c_2
-            * P_0_psi**0.8
-            * t
-            / ((structure.nozzle.throat_diameter / 0.0254) ** 0.2)
+        # Subexpressions shared by the empirical correlations below, in
+        # the imperial units that they are written in:
+        nozzle = structure.nozzle
+        throat_diameter_in = nozzle.throat_diameter / 0.0254
+        throat_diameter_in_0_2 = throat_diameter_in**0.2
+        expansion_ratio = nozzle.expansion_ratio
+        P_0_psi_0_8 = P_0_psi**0.8
+
+        termc_2 = 1 + 2 * math.exp(
+            -nozzle.material.c_2 * P_0_psi_0_8 * t / throat_diameter_in_0_2
         )
-        E_cf = 1 + 0.016 * structure.nozzle.expansion_ratio**-9
+        E_cf = 1 + 0.016 * expansion_ratio**-9
         n_bl = (
-            structure.nozzle.material.c_1
-            * (
-                (P_0_psi**0.8)
-                / ((structure.nozzle.throat_diameter / 0.0254) ** 0.2)
-            )
+            nozzle.material.c_1
+            * (P_0_psi_0_8 / throat_diameter_in_0_2)
             * termc_2
             * E_cf
         )
@@ -301,48 +391,28 @@ def get_operational_correction_factors(
             * (propellant.qsi_ch**0.33)
             * (
                 1
-                - np.exp(
+                - math.exp(
                     -0.004
-                    * (V0 / get_circle_area(structure.nozzle.throat_diameter))
+                    * (V0 / get_circle_area(nozzle.throat_diameter))
                     / 0.0254
                 )
-                * (1 + 0.045 * structure.nozzle.throat_diameter / 0.0254)
+                * (1 + 0.045 * throat_diameter_in)
             )
         )
 
-        if 1 / propellant.M_ch >= 0.9:
-            C4 = 0.5
-            if structure.nozzle.throat_diameter / 0.0254 < 1:
-                C3, C5, C6 = 9, 1, 1
-            elif 1 <= structure.nozzle.throat_diameter / 0.0254 < 2:
-                C3, C5, C6 = 9, 1, 0.8
-            elif structure.nozzle.throat_diameter / 0.0254 >= 2:
-                if C7 < 4:
-                    C3, C5, C6 = 13.4, 0.8, 0.8
-                elif 4 <= C7 <= 8:
-                    C3, C5, C6 = 10.2, 0.8, 0.4
-                elif C7 > 8:
-                    C3, C5, C6 = 7.58, 0.8, 0.33
-        elif 1 / propellant.M_ch < 0.9:
-            C4 = 1
-            if structure.nozzle.throat_diameter / 0.0245 < 1:
-                C3, C5, C6 = 44.5, 0.8, 0.8
-            elif 1 <= structure.nozzle.throat_diameter / 0.0254 < 2:
-                C3, C5, C6 = 30.4, 0.8, 0.4
-            elif structure.nozzle.throat_diameter / 0.0254 >= 2:
-                if C7 < 4:
-                    C3, C5, C6 = 44.5, 0.8, 0.8
-                elif 4 <= C7 <= 8:
-                    C3, C5, C6 = 30.4, 0.8, 0.4
-                elif C7 > 8:
-                    C3, C5, C6 = 25.2, 0.8, 0.33
+        # Selecting the row of the coefficient table, see
+        # _TWO_PHASE_FLOW_COEFFICIENTS:
+        if throat_diameter_in < 2:
+            size_bin = int(throat_diameter_in >= 1)
+        else:
+            size_bin = 2 + (C7 >= 4) + (C7 > 8)
+
+        C3, C4, C5, C6 = _TWO_PHASE_FLOW_COEFFICIENTS[
+            1 / propellant.M_ch < 0.9
+        ][size_bin]
         n_tp = C3 * (
             (propellant.qsi_ch * C4 * C7**C5)
-            / (
-                P_0_psi**0.15
-                * structure.nozzle.expansion_ratio**0.08
-                * (structure.nozzle.throat_diameter / 0.0254) ** C6
-            )
+            / (P_0_psi**0.15 * expansion_ratio**0.08 * throat_diameter_in**C6)
         )
     else:
         n_tp = 0
@@ -385,17 +455,24 @@ def get_expansion_ratio(
     Example:
         expansion_ratio = get_expansion_ratio([5000, 6000], [100000, 150000], 1.4, 0.5)
     """
-    E = np.zeros(np.size(P_0))
-
-    for i in range(np.size(P_0)):
-        if P_e[i] / P_0[i] <= critical_pressure_ratio:
-            pressure_ratio = P_e[i] / P_0[i]
-            E[i] = (
-                ((k + 1) / 2) ** (1 / (k - 1))
-                * pressure_ratio ** (1 / k)
-                * ((k + 1) / (k - 1) * (1 - pressure_ratio ** ((k - 1) / k)))
-                ** 0.5
-            ) ** -1
-        else:
-            E[i] = 1
+    pressure_ratio = np.asarray(P_e, dtype=np.float64) / np.asarray(
+        P_0, dtype=np.float64
+    )
+    choked = pressure_ratio <= critical_pressure_ratio
+
+    # Unchoked points are replaced by a harmless ratio before evaluating the
+    # expression, and are then assigned an expansion ratio of 1:
+    pressure_ratio = np.where(choked, pressure_ratio, 0.5)
+    E = np.where(
+        choked,
+        1
+        / (
+            ((k + 1) / 2) ** (1 / (k - 1))
+            * pressure_ratio ** (1 / k)
+            * np.sqrt(
+                (k + 1) / (k - 1) * (1 - pressure_ratio ** ((k - 1) / k))
+            )
+        ),
+        1.0,
+    )
     return np.mean(E)
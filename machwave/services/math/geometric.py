@@ -1,19 +1,25 @@
-from typing import Optional
+from typing import Optional, Union
 import numpy as np
 from skimage import measure
 
+# pi / 4, as a plain float so that circle areas need no attribute lookup:
+_QUARTER_PI = np.pi / 4
 
-def get_circle_area(diameter: float) -> float:
+
+def get_circle_area(
+    diameter: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Returns the area of a circle based on the circle's diameter.
 
     Args:
-        diameter (float): The diameter of the circle.
+        diameter (Union[float, np.ndarray]): The diameter of the circle, or
+            an array of diameters.
 
     Returns:
-        float: The area of the circle.
+        Union[float, np.ndarray]: The area of the circle.
     """
-    return np.pi * 0.25 * diameter**2
+    return _QUARTER_PI * (diameter * diameter)
 
 
 def get_torus_area(major_radius: float, minor_radius: float) -> float:
@@ -110,12 +116,14 @@ def get_length(
     Returns:
         float: The total length of the segments.
     """
-    offset = np.roll(contour.T, 1, axis=1)
-    lengths = np.linalg.norm(contour.T - offset, axis=0)
+    # Segment i joins point i - 1 to point i, the contour being closed:
+    segments = np.diff(contour, axis=0, prepend=contour[-1:])
+    lengths = np.hypot(segments[:, 0], segments[:, 1])
 
-    center_offset = np.array([[map_size / 2, map_size / 2]])
-    radius = np.linalg.norm(contour - center_offset, axis=1)
+    half_map_size = map_size / 2
+    centered = contour - half_map_size
+    radius = np.hypot(centered[:, 0], centered[:, 1])
 
-    valid = radius < (map_size / 2) - tolerance
+    valid = radius < half_map_size - tolerance
 
     return np.sum(lengths[valid])
@@ -20,7 +20,7 @@ def thrust_pressure_plot(
     figure = plotly.subplots.make_subplots(specs=[[{"secondary_y": True}]])
 
     figure.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=time,
             y=thrust,
             mode="lines",
@@ -31,7 +31,7 @@ def thrust_pressure_plot(
     )
 
     figure.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=time,
             y=chamber_pressure * 1e-6,
             mode="lines",
@@ -71,9 +71,10 @@ def mass_flux_plot(time: np.ndarray, mass_flux: np.ndarray) -> go.Figure:
 
     for i in range(len(mass_flux)):
         figure.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=time,
                 y=mass_flux[i, :],
+                mode="lines",
                 name="Segment " + str(i + 1),
             )
         )
@@ -1,3 +1,5 @@
+from copy import copy
+
 import numpy as np
 
 from machwave.models.atmosphere import Atmosphere
@@ -7,6 +9,33 @@ from machwave.operations.ballistics._1dof import Ballistic1DOperation
 from machwave.simulations import Simulation, SimulationParameters
 
 
+def _interpolate(xp: np.ndarray, fp: np.ndarray, x: float, j: int) -> float:
+    """
+    Linear interpolation of 'fp' at 'x', inside the known interval
+    [xp[j], xp[j + 1]].
+
+    Unlike np.interp, no NaN, monotonicity or boundary checks are made. The
+    tables must be validated beforehand. As in np.interp, a zero-width
+    interval evaluates to its right value.
+
+    Args:
+        xp (np.ndarray): Non-decreasing x coordinates.
+        fp (np.ndarray): y coordinates.
+        x (float): Point to be evaluated.
+        j (int): Index of the interval that contains 'x'.
+
+    Returns:
+        float: The interpolated value.
+    """
+    x_0 = xp[j]
+    width = xp[j + 1] - x_0
+
+    if width == 0:
+        return fp[j + 1]
+
+    return fp[j] + (fp[j + 1] - fp[j]) * ((x - x_0) / width)
+
+
 class BallisticSimulationParameters(SimulationParameters):
     """
     Parameters for a ballistic simulation.
@@ -39,6 +68,66 @@ class BallisticSimulationParameters(SimulationParameters):
         self.initial_elevation_amsl = initial_elevation_amsl
         self.rail_length = rail_length
 
+        self.validate_tables()
+
+    def validate_tables(self) -> None:
+        """
+        Validates the thrust curve once, so that the simulation loop can
+        interpolate it without any further checks.
+
+        Raises:
+            ValueError: If the time and thrust arrays are empty, are not
+                finite, do not have the same length or if time is
+                decreasing. Repeated time values are allowed, e.g. for a
+                step in the thrust curve.
+        """
+        time = np.asarray(self.time, dtype=np.float64)
+        thrust = np.asarray(self.thrust, dtype=np.float64)
+
+        if time.shape != thrust.shape or time.size < 1:
+            raise ValueError(
+                "'time' and 'thrust' must be non-empty arrays with the same "
+                "length."
+            )
+        if not (np.all(np.isfinite(time)) and np.all(np.isfinite(thrust))):
+            raise ValueError("'time' and 'thrust' must be finite.")
+        if np.any(np.diff(time) < 0):
+            raise ValueError("'time' must be non-decreasing.")
+
+    def replace(self, **changes) -> "BallisticSimulationParameters":
+        """
+        Returns a copy of the parameters with some attributes replaced, e.g.
+        for sweeps over the time step, elevation or rail length.
+
+        The copy is shallow, so the thrust curve arrays are shared with the
+        original instead of being copied for every sweep point. The tables
+        are only validated again if they are replaced.
+
+        Args:
+            **changes: New values, keyed by attribute name.
+
+        Returns:
+            BallisticSimulationParameters: The new parameters.
+
+        Raises:
+            ValueError: If an attribute does not exist, or if a replaced
+                thrust curve is invalid.
+        """
+        unknown = set(changes) - set(vars(self))
+
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters: {', '.join(sorted(unknown))}."
+            )
+
+        new_params = copy(self)
+        vars(new_params).update(changes)
+
+        if "time" in changes or "thrust" in changes:
+            new_params.validate_tables()
+
+        return new_params
+
 
 class BallisticSimulation(Simulation):
     """
@@ -70,7 +159,7 @@ class BallisticSimulation(Simulation):
         super().__init__(params=params)
         self.rocket = rocket
         self.atmosphere = atmosphere
-        self.t = np.array([0])
+        self.t = None
         self.ballistic_operation = None
 
     def get_propellant_mass(self) -> np.ndarray:
@@ -80,16 +169,11 @@ class BallisticSimulation(Simulation):
         Returns:
             np.ndarray: Array of propellant mass values.
         """
-        initial_propellant_mass = self.params.initial_propellant_mass
-        prop_mass = np.array([])
-        time = self.params.time
-
-        for t in time:
-            prop_mass = np.append(
-                prop_mass, initial_propellant_mass * (time[-1] - t) / time[-1]
-            )
+        time = np.asarray(self.params.time, dtype=np.float64)
 
-        return prop_mass
+        return (
+            self.params.initial_propellant_mass * (time[-1] - time) / time[-1]
+        )
 
     def run(self) -> tuple[np.array, Ballistic1DOperation]:
         """
@@ -109,36 +193,47 @@ class BallisticSimulation(Simulation):
             initial_elevation_amsl=self.params.initial_elevation_amsl,
         )
 
-        propellant_mass = self.get_propellant_mass()
-
-        i = 0
-
-        while self.ballistic_operation.y[i] >= 0:
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
-
-            thrust = np.interp(
-                self.t[-1],
-                self.params.time,
-                self.params.thrust,
-                left=0,
-                right=0,
-            )  # interpolating thrust with new time value
-
-            self.ballistic_operation.iterate(
-                np.interp(
-                    self.t[-1],
-                    self.params.time,
-                    propellant_mass,
-                    left=0,
-                    right=0,
-                ),  # interpolating propellant mass with new time value
-                thrust,
-                self.params.d_t,
-            )
+        time = np.asarray(self.params.time, dtype=np.float64)
+        thrust_table = np.asarray(self.params.thrust, dtype=np.float64)
+        propellant_mass_table = self.get_propellant_mass()
+
+        if time.size == 1:  # a single point is a zero-width interval
+            time = np.repeat(time, 2)
+            thrust_table = np.repeat(thrust_table, 2)
+            propellant_mass_table = np.repeat(propellant_mass_table, 2)
+
+        # Time only moves forward, so the interpolation interval is tracked
+        # with a cursor instead of being searched for on every step:
+        last_interval = len(time) - 2
+        j = 0
+
+        d_t = self.params.d_t
+        ballistic_operation = self.ballistic_operation
+        ballistic_iterate = ballistic_operation.iterate
+
+        t = 0.0
+        t_values = [t]
+
+        while ballistic_operation.y_last >= 0:
+            t += d_t  # new time value
+            t_values.append(t)
+
+            if time[0] <= t <= time[-1]:
+                while j < last_interval and time[j + 1] <= t:
+                    j += 1
+
+                # Interpolating thrust and propellant mass with new time value
+                thrust = _interpolate(time, thrust_table, t, j)
+                propellant_mass = _interpolate(
+                    time, propellant_mass_table, t, j
+                )
+            else:
+                thrust = 0
+                propellant_mass = 0
+
+            ballistic_iterate(propellant_mass, thrust, d_t)
 
-            i += 1
+        self.t = np.asarray(t_values, dtype=np.float64)
 
         return (self.t, self.ballistic_operation)
 
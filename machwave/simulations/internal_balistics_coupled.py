@@ -8,6 +8,8 @@ ballistic of the motor. The main attribute that changes during flight is the
 ambient pressure, which impacts motor performance.
 """
 
+from typing import Optional
+
 import numpy as np
 
 from machwave.models.atmosphere import Atmosphere
@@ -75,26 +77,36 @@ class InternalBallisticsCoupled(Simulation):
         """
         super().__init__(params=params)
         self.rocket = rocket
-        self.t = np.array([0])
+        self.t = None
         self.motor_operation = None
         self.ballistic_operation = None
 
-    def get_motor_operation(self) -> MotorOperation:
+    def get_motor_operation(
+        self, initial_atmospheric_pressure: Optional[float] = None
+    ) -> MotorOperation:
         """
         Returns the motor operation object based on the type of the motor.
 
+        Args:
+            initial_atmospheric_pressure (float, optional): Atmospheric
+                pressure at the initial elevation. Evaluated from the
+                atmosphere if not provided.
+
         Returns:
             MotorOperation: The motor operation object.
         """
+        if initial_atmospheric_pressure is None:
+            initial_atmospheric_pressure = self.params.atmosphere.get_pressure(
+                self.params.initial_elevation_amsl
+            )
+
         motor_operation_class = get_motor_operation_class(
             self.rocket.propulsion
         )
         return motor_operation_class(
             motor=self.rocket.propulsion,
             initial_pressure=self.params.igniter_pressure,
-            initial_atmospheric_pressure=self.params.atmosphere.get_pressure(
-                self.params.initial_elevation_amsl
-            ),
+            initial_atmospheric_pressure=initial_atmospheric_pressure,
         )
 
     def run(self) -> tuple[MotorOperation, Ballistic1DOperation]:
@@ -106,7 +118,6 @@ class InternalBallisticsCoupled(Simulation):
             tuple[MotorOperation, Ballistic1DOperation]: A tuple containing
             the motor operation object and the ballistic operation object.
         """
-        self.motor_operation = self.get_motor_operation()
         self.ballistic_operation = Ballistic1DOperation(
             self.rocket,
             self.params.atmosphere,
@@ -115,37 +126,49 @@ class InternalBallisticsCoupled(Simulation):
             initial_vehicle_mass=self.rocket.get_launch_mass(),
             initial_elevation_amsl=self.params.initial_elevation_amsl,
         )
+        # The ballistic operation already queried the atmosphere at the
+        # initial elevation:
+        self.motor_operation = self.get_motor_operation(
+            initial_atmospheric_pressure=self.ballistic_operation.P_ext[0]
+        )
 
-        i = 0
+        d_t = self.params.d_t
+        motor_iterate = self.motor_operation.iterate
+        ballistic_operation = self.ballistic_operation
+        ballistic_iterate = ballistic_operation.iterate
 
-        while (
-            self.ballistic_operation.y[i] >= 0
-            or self.motor_operation.m_prop[-1] > 0
+        # Scalars carried between iterations, so that the loop does not have
+        # to index the (growing) operation vectors on every step:
+        P_ext = self.ballistic_operation.P_ext[0]
+        propellant_mass = self.motor_operation.m_prop[0]
+        thrust = self.motor_operation.thrust[0]
+
+        t_current = 0.0
+        t = [t_current]
+
+        # Powered phase, motor and flight are iterated together:
+        while not self.motor_operation.end_thrust and (
+            ballistic_operation.y_last >= 0 or propellant_mass > 0
         ):
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
-
-            if self.motor_operation.end_thrust is False:
-                self.motor_operation.iterate(
-                    self.params.d_t,
-                    self.ballistic_operation.P_ext[i],
-                )
-
-                propellant_mass = self.motor_operation.m_prop[i]
-                thrust = self.motor_operation.thrust[i]
-                d_t = self.params.d_t
-            else:
-                propellant_mass = 0
-                thrust = 0
-
-                # Adding new delta time value for ballistic simulation:
-                d_t = self.params.d_t * self.params.dd_t
-                self.t[-1] = self.t[-2] + self.params.dd_t * self.params.d_t
-
-            self.ballistic_operation.iterate(propellant_mass, thrust, d_t)
-
-            i += 1
+            t_current += d_t  # new time value
+            t.append(t_current)
+
+            # The ballistic step uses the motor state at the beginning of
+            # the time step:
+            motor_state = motor_iterate(d_t, P_ext)
+            P_ext = ballistic_iterate(propellant_mass, thrust, d_t)
+            propellant_mass, thrust = motor_state
+
+        # Coast phase, only the flight is iterated, with a coarser time step:
+        d_t_coast = d_t * self.params.dd_t
+
+        while ballistic_operation.y_last >= 0:
+            t_current += d_t_coast  # new time value
+            t.append(t_current)
+
+            ballistic_iterate(0, 0, d_t_coast)
+
+        self.t = np.asarray(t, dtype=np.float64)
 
         return (self.motor_operation, self.ballistic_operation)
 
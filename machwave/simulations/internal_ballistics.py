@@ -53,7 +53,7 @@ class InternalBallistics(Simulation):
         """
         super().__init__(params=params)
         self.motor = motor
-        self.t = np.array([0])
+        self.t = None
         self.motor_operation = None
 
     def get_motor_operation(self) -> MotorOperation:
@@ -81,19 +81,21 @@ class InternalBallistics(Simulation):
         """
         self.motor_operation = self.get_motor_operation()
 
-        i = 0
+        d_t = self.params.d_t
+        external_pressure = self.params.external_pressure
+        motor_iterate = self.motor_operation.iterate
+
+        # Collected in a list, as np.append copies on every call:
+        t_current = 0.0
+        t = [t_current]
 
         while not self.motor_operation.end_thrust:
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
+            t_current += d_t  # new time value
+            t.append(t_current)
 
-            self.motor_operation.iterate(
-                self.params.d_t,
-                self.params.external_pressure,
-            )
+            motor_iterate(d_t, external_pressure)
 
-            i += 1
+        self.t = np.asarray(t, dtype=np.float64)
 
         return (self.t, self.motor_operation)
 
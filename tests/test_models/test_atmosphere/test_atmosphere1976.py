@@ -106,3 +106,19 @@ def test_get_wind_velocity_negative_altitude(atmosphere1976withwindpowerlaw):
         [expected_northward, expected_eastward],
         decimal=5,
     )
+
+
+def test_atmosphere1976_get_properties_matches_getters():
+    """
+    Test that the fused query returns the same values as the individual
+    getters.
+    """
+    atmosphere1976 = Atmosphere1976()
+
+    for y_amsl in [0, 1500.0, 11000.0, 30000.0]:
+        assert atmosphere1976.get_properties(y_amsl) == (
+            atmosphere1976.get_density(y_amsl),
+            atmosphere1976.get_pressure(y_amsl),
+            atmosphere1976.get_gravity(y_amsl),
+            atmosphere1976.get_sonic_velocity(y_amsl),
+        )
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from machwave.models.propulsion.grain.geometries import BatesSegment
@@ -66,3 +67,31 @@ def test_olympus_grain_segment_count(bates_grain_olympus):
     assert bates_grain_olympus.segment_count == len(
         bates_grain_olympus.segments
     )
+
+
+def test_olympus_grain_mass_flux_per_segment(bates_grain_olympus):
+    grain = bates_grain_olympus
+    web_distance = np.linspace(0, 20e-3, 5)
+    burn_rate = np.linspace(5e-3, 8e-3, 5)
+    density = 1700
+
+    mass_flux = grain.get_mass_flux_per_segment(
+        burn_rate, density, web_distance
+    )
+
+    assert mass_flux.shape == (grain.segment_count, web_distance.size)
+
+    for j in range(grain.segment_count):
+        for i, web in enumerate(web_distance):
+            burn_area = sum(
+                segment.get_burn_area(web)
+                for segment in grain.segments[: j + 1]
+            )
+            expected = (
+                burn_area
+                * density
+                * burn_rate[i]
+                / grain.segments[j].get_port_area(web)
+            )
+
+            assert mass_flux[j, i] == pytest.approx(expected)
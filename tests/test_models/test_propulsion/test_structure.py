@@ -1,3 +1,11 @@
+import numpy as np
+from pytest import approx
+
+from machwave.models.materials.metals import Steel
+from machwave.models.propulsion.structure import Nozzle
+from machwave.models.propulsion.structure.chamber import CombustionChamber
+
+
 def _test_combustion_chamber_properties(combustion_chamber):
     """
     Generic test function for CombustionChamber and its descendents.
@@ -33,3 +41,112 @@ def test_bolted_combustion_chamber_properties(
     bolted_combustion_chamber_olympus,
 ):
     _test_combustion_chamber_properties(bolted_combustion_chamber_olympus)
+
+
+def test_chamber_length(combustion_chamber_olympus):
+    """
+    chamber_length is a static method, callable from the class or from an
+    instance.
+    """
+    assert CombustionChamber.chamber_length(
+        [0.2, 0.2, 0.25], 3, 0.01
+    ) == approx(0.67)
+    assert combustion_chamber_olympus.chamber_length(0.2, 1, 0.01) == approx(
+        0.2
+    )
+
+
+def test_structural_methods_vectorized_over_trials(
+    bolted_combustion_chamber_olympus,
+):
+    """
+    Evaluating the structural methods on arrays of chamber pressures and
+    safety factors must match evaluating them trial by trial.
+    """
+    chamber = bolted_combustion_chamber_olympus
+    nozzle = Nozzle(
+        throat_diameter=37e-3,
+        divergent_angle=12,
+        convergent_angle=45,
+        expansion_ratio=8,
+        material=Steel(),
+    )
+
+    pressures = np.linspace(3e6, 8e6, 5)
+    safety_factors = np.linspace(2, 4, 5)
+
+    casing_sf = chamber.get_casing_safety_factor(pressures)
+    bulkhead_t = chamber.get_bulkhead_thickness(pressures, safety_factors)
+    conv_t, div_t = nozzle.get_nozzle_thickness(
+        pressures, safety_factors, chamber
+    )
+
+    for i, (pressure, sf) in enumerate(zip(pressures, safety_factors)):
+        assert casing_sf[i] == approx(
+            chamber.get_casing_safety_factor(pressure)
+        )
+        assert bulkhead_t[i] == approx(
+            chamber.get_bulkhead_thickness(pressure, sf)
+        )
+        assert (conv_t[i], div_t[i]) == approx(
+            nozzle.get_nozzle_thickness(pressure, sf, chamber)
+        )
+
+
+def test_optimal_fasteners_match_per_screw_count_evaluation(
+    bolted_combustion_chamber_olympus,
+):
+    chamber = bolted_combustion_chamber_olympus
+    chamber_pressure = 5e6
+
+    (
+        optimal_fasteners,
+        max_safety_factor,
+        shear_sf,
+        tear_sf,
+        compression_sf,
+    ) = chamber.get_optimal_fasteners(chamber_pressure)
+
+    assert shear_sf.shape == (chamber.max_screw_count,)
+
+    for index, screw_count in enumerate(range(1, chamber.max_screw_count + 1)):
+        force = chamber.get_force_on_each_fastener(
+            screw_count=screw_count, chamber_pressure=chamber_pressure
+        )
+
+        assert shear_sf[index] == approx(
+            chamber.screw_material.ultimate_strength
+            / (force / chamber.get_shear_area())
+        )
+        assert tear_sf[index] == approx(
+            chamber.casing_material.yield_strength
+            / np.sqrt(3)
+            / (force / chamber.get_tear_area(screw_count))
+        )
+        assert compression_sf[index] == approx(
+            chamber.casing_material.yield_strength
+            / (force / chamber.get_compression_area())
+        )
+
+    min_sf = np.minimum(np.minimum(shear_sf, tear_sf), compression_sf)
+    assert optimal_fasteners == np.argmax(min_sf)
+    assert max_safety_factor == np.max(min_sf)
+
+
+def test_optimal_fasteners_vectorized_over_trials(
+    bolted_combustion_chamber_olympus,
+):
+    chamber = bolted_combustion_chamber_olympus
+    pressures = np.linspace(3e6, 8e6, 4)
+
+    batch = chamber.get_optimal_fasteners(pressures)
+
+    assert batch[2].shape == (pressures.size, chamber.max_screw_count)
+
+    for i, pressure in enumerate(pressures):
+        single = chamber.get_optimal_fasteners(pressure)
+
+        assert batch[0][i] == single[0]
+        assert batch[1][i] == approx(single[1])
+        for batch_values, values in zip(batch[2:], single[2:]):
+            np.testing.assert_allclose(batch_values[i], values)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from machwave.montecarlo import MonteCarloParameter, MonteCarloSimulation
+from machwave.operations import Operation
+from machwave.simulations import Simulation
+
+
+class _SquareOperation(Operation):
+    def __init__(self, value: float) -> None:
+        self.values = np.array([value])
+
+    def iterate(self, value: float) -> None:
+        self._append_values(values=value)
+
+    def print_results(self) -> None:
+        pass
+
+
+class _SquareSimulation(Simulation):
+    def run(self) -> list[Operation]:
+        operation = _SquareOperation(self.params)
+        operation.iterate(self.params**2)
+        return [operation]
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_run_with_worker_processes_matches_sequential_run():
+    parameter = MonteCarloParameter(value=2.0, tolerance=0.1)
+    sequential = MonteCarloSimulation([parameter], 4, _SquareSimulation)
+    parallel = MonteCarloSimulation([parameter], 4, _SquareSimulation)
+
+    np.random.seed(0)
+    sequential.run()
+    np.random.seed(0)
+    parallel.run(max_workers=2)
+
+    assert len(parallel.results) == 4
+    for expected, result in zip(sequential.results, parallel.results):
+        np.testing.assert_array_equal(result[0].values, expected[0].values)
+        assert "_buffers" not in vars(result[0])
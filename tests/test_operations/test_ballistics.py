@@ -0,0 +1,43 @@
+import numpy as np
+from pytest import approx
+
+from machwave.operations.ballistics._1dof import solve_ballistics_rk4
+from machwave.services.equations import ballistics_ode
+from machwave.solvers.odes import rk4th_ode_solver
+
+
+def test_solve_ballistics_rk4_matches_generic_solver():
+    kwargs = dict(T=1500.0, D=0.02, M=25.0, g=9.81)
+
+    for y, v in [(0.0, 0.0), (120.0, 85.0), (3000.0, -40.0)]:
+        expected = rk4th_ode_solver(
+            variables={"y": y, "v": v},
+            equation=ballistics_ode,
+            d_t=0.01,
+            **kwargs,
+        )
+        result = solve_ballistics_rk4(y=y, v=v, d_t=0.01, **kwargs)
+
+        assert result == approx(expected)
+
+
+def test_solve_ballistics_rk4_batch_matches_scalar_calls():
+    y = np.array([0.0, 120.0, 3000.0])
+    v = np.array([0.0, 85.0, -40.0])
+    T = np.array([1500.0, 800.0, 0.0])
+    D = np.array([0.02, 0.02, 0.5])
+
+    batch = solve_ballistics_rk4(y=y, v=v, d_t=0.01, T=T, D=D, M=25.0, g=9.81)
+
+    for index in range(len(y)):
+        scalar = solve_ballistics_rk4(
+            y=y[index],
+            v=v[index],
+            d_t=0.01,
+            T=T[index],
+            D=D[index],
+            M=25.0,
+            g=9.81,
+        )
+
+        assert [value[index] for value in batch] == approx(scalar)
@@ -0,0 +1,39 @@
+import numpy as np
+
+from machwave.operations import Operation
+
+
+class _VectorOperation(Operation):
+    def __init__(self) -> None:
+        self.t = np.array([0.0])
+        self.x = np.array([1.0])
+
+    def iterate(self, t: float, x: float) -> None:
+        self._append_values(t=t, x=x)
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_append_values_matches_np_append():
+    operation = _VectorOperation()
+    expected_t, expected_x = np.array([0.0]), np.array([1.0])
+
+    for index in range(1, 200):
+        operation.iterate(t=0.01 * index, x=float(index) ** 2)
+        expected_t = np.append(expected_t, 0.01 * index)
+        expected_x = np.append(expected_x, float(index) ** 2)
+
+    np.testing.assert_array_equal(operation.t, expected_t)
+    np.testing.assert_array_equal(operation.x, expected_x)
+
+
+def test_append_values_after_reassignment():
+    operation = _VectorOperation()
+    operation.iterate(t=1.0, x=2.0)
+
+    operation.x = np.array([5.0, 6.0, 7.0])
+    operation.iterate(t=2.0, x=8.0)
+
+    np.testing.assert_array_equal(operation.t, [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(operation.x, [5.0, 6.0, 7.0, 8.0])
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from machwave.services.conversions import (
@@ -36,3 +37,15 @@ def test_convert_mass_flux_metric_to_imperial():
     assert convert_mass_flux_metric_to_imperial(-0.002) == pytest.approx(
         -2.84466e-6, rel=1e-2
     )
+
+
+def test_conversions_accept_arrays():
+    pressure_pa = np.array([0.0, 1e5, 2.5e6])
+
+    np.testing.assert_allclose(
+        convert_pa_to_psi(pressure_pa),
+        [convert_pa_to_psi(value) for value in pressure_pa],
+    )
+    np.testing.assert_allclose(
+        convert_mpa_to_pa(convert_pa_to_mpa(pressure_pa)), pressure_pa
+    )
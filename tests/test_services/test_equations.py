@@ -0,0 +1,41 @@
+from pytest import approx, raises
+
+from machwave.services.equations import make_seidel_rhs, solve_cp_seidel
+from machwave.services.isentropic_flow import get_critical_pressure_ratio
+
+
+def test_solve_cp_seidel_precomputed_critical_pressure_ratio():
+    k = 1.13
+    args = (1e5, 0.05, 1e-3, 2e-4, 1800, k, 200, 1600, 5e-3)
+
+    for P0 in [1.5e5, 2e6, 7e6]:  # unchoked and choked flow
+        assert solve_cp_seidel(
+            P0, *args, get_critical_pressure_ratio(k)
+        ) == approx(solve_cp_seidel(P0, *args))
+
+
+def test_make_seidel_rhs_reference_values():
+    At, pp, k, R, T0 = 1e-3, 1800, 1.13, 200, 1600
+    seidel_rhs = make_seidel_rhs(At, pp, k, R, T0)
+    expected = {  # unchoked and choked flow
+        1.5e5: 456214975.3834349,
+        2e6: -2869697137.6526995,
+        7e6: -11843939981.78445,
+    }
+
+    for P0, dP0_dt in expected.items():
+        assert seidel_rhs(P0, 1e5, 0.05, 2e-4, 5e-3) == approx(dP0_dt)
+        assert solve_cp_seidel(
+            P0, 1e5, 0.05, 2e-4, At, pp, k, R, T0, 5e-3
+        ) == approx((dP0_dt,))
+
+
+def test_seidel_equation_raises_for_external_pressure_above_chamber():
+    At, pp, k, R, T0 = 1e-3, 1800, 1.13, 200, 1600
+    seidel_rhs = make_seidel_rhs(At, pp, k, R, T0)
+
+    with raises(ValueError):
+        solve_cp_seidel(1e5, 1.2e5, 0.05, 2e-4, At, pp, k, R, T0, 5e-3)
+
+    with raises(ValueError):
+        seidel_rhs(1e5, 1.2e5, 0.05, 2e-4, 5e-3)
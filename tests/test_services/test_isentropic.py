@@ -1,6 +1,8 @@
+from types import SimpleNamespace
+
 import numpy as np
 
-from pytest import approx, mark
+from pytest import approx, mark, raises
 
 from machwave.services.isentropic_flow import (
     get_critical_pressure_ratio,
@@ -34,6 +36,18 @@ def test_get_opt_expansion_ratio():
     assert exp_opt == approx(9.37, rel=1e-2)
 
 
+def test_get_opt_expansion_ratio_array():
+    k = 1.15
+    P_0 = np.array([2e6, 4e6, 6.4e6])
+    P_ext = 1e5
+    exp_opt = get_opt_expansion_ratio(k, P_0, P_ext)
+
+    assert exp_opt.shape == P_0.shape
+    assert exp_opt == approx(
+        [get_opt_expansion_ratio(k, P, P_ext) for P in P_0]
+    )
+
+
 def test_get_exit_mach():
     k = 1.4
     expansion_ratio = 8
@@ -42,6 +56,34 @@ def test_get_exit_mach():
     assert exit_mach == approx(3.677229)
 
 
+@mark.parametrize("k", [1.1, 1.2, 1.4, 1.67])
+@mark.parametrize("expansion_ratio", [1.0001, 1.05, 3, 8, 100])
+def test_get_exit_mach_satisfies_area_mach_relation(k, expansion_ratio):
+    exit_mach = get_exit_mach(k, expansion_ratio)
+    area_ratio = (
+        ((1 + 0.5 * (k - 1) * exit_mach**2) / (1 + 0.5 * (k - 1)))
+        ** ((k + 1) / (2 * (k - 1)))
+    ) / exit_mach
+
+    assert exit_mach > 1
+    assert area_ratio == approx(expansion_ratio, rel=1e-12)
+
+
+def test_get_exit_mach_is_memoized():
+    get_exit_mach.cache_clear()
+
+    first = get_exit_mach(1.25, 6.5)
+    second = get_exit_mach(1.25, 6.5)
+
+    assert first == second
+    assert get_exit_mach.cache_info().hits == 1
+
+
+def test_get_exit_mach_subsonic_expansion_ratio():
+    with raises(ValueError):
+        get_exit_mach(1.4, 1)
+
+
 def test_get_exit_pressure():
     k_2ph_ex = 1.4
     E = 8
@@ -123,3 +165,60 @@ def test_get_expansion_ratio():
     expansion_ratio = get_expansion_ratio(P_e, P_0, k, critical_pressure_ratio)
 
     assert expansion_ratio == approx(3.11, rel=1e-2)
+
+
+def test_get_expansion_ratio_unchoked_points():
+    P_e = np.array([5000, 90000, 6000])
+    P_0 = np.array([100000, 100000, 150000])
+    k = 1.4
+    critical_pressure_ratio = 0.5
+
+    expansion_ratio = get_expansion_ratio(P_e, P_0, k, critical_pressure_ratio)
+    choked_only = get_expansion_ratio(
+        P_e[[0, 2]], P_0[[0, 2]], k, critical_pressure_ratio
+    )
+
+    # The unchoked point contributes an expansion ratio of 1 to the mean:
+    assert expansion_ratio == approx((2 * choked_only + 1) / 3)
+
+
+def test_get_operational_correction_factors_throat_diameter_bin():
+    """
+    A 25 mm throat is below 1 inch, so the two-phase flow correlation must
+    use the small throat coefficients for propellants with 1 / M_ch < 0.9.
+    """
+    propellant = SimpleNamespace(
+        Isp_frozen=150, Isp_shifting=160, qsi_ch=0.5, M_ch=1.2
+    )
+    nozzle = SimpleNamespace(
+        throat_diameter=0.025,
+        expansion_ratio=8,
+        material=SimpleNamespace(c_1=0.00506, c_2=0.0),
+    )
+    structure = SimpleNamespace(nozzle=nozzle)
+    P_0 = 1.5e5
+    P_0_psi = P_0 / 6894.757
+    V0 = 1e-3
+
+    _, n_tp, _ = get_operational_correction_factors(
+        P_0, 1e5, P_0_psi, propellant, structure, 0.5, V0, 0.0
+    )
+
+    throat_diameter_in = 0.025 / 0.0254
+    C7 = (
+        0.454
+        * P_0_psi**0.33
+        * 0.5**0.33
+        * (
+            1
+            - np.exp(-0.004 * (V0 / (np.pi * 0.025**2 / 4)) / 0.0254)
+            * (1 + 0.045 * throat_diameter_in)
+        )
+    )
+    C3, C4, C5, C6 = 44.5, 1, 0.8, 0.8
+    expected_n_tp = C3 * (
+        (0.5 * C4 * C7**C5)
+        / (P_0_psi**0.15 * 8**0.08 * throat_diameter_in**C6)
+    )
+
+    assert n_tp == approx(expected_n_tp)
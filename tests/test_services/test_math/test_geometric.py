@@ -18,6 +18,12 @@ def test_get_circle_area():
     expected_area = 12.56637
     assert pytest.approx(get_circle_area(diameter), rel=1e-4) == expected_area
 
+    # Arrays of diameters are evaluated element-wise:
+    diameters = np.array([1.0, 2.0, 4.0])
+    assert get_circle_area(diameters) == pytest.approx(
+        np.pi * diameters**2 / 4
+    )
+
 
 def test_get_torus_area():
     # Test case: Torus with major radius 2 and minor radius 1
@@ -61,3 +67,17 @@ def test_get_cylinder_volume():
         pytest.approx(get_cylinder_volume(diameter, length), rel=1e-4)
         == expected_volume
     )
+
+
+def test_get_length():
+    # Test case: Closed square of side 2 centered in a map of size 20
+    contour = np.array([[9.0, 9.0], [9.0, 11.0], [11.0, 11.0], [11.0, 9.0]])
+    assert get_length(contour, map_size=20) == pytest.approx(8.0)
+
+    # Test case: The segment ending at (4, 4) is within the tolerance of the
+    # map edge, so only the other two segments are counted
+    contour = np.array([[9.0, 9.0], [9.0, 11.0], [4.0, 4.0]])
+    expected_length = np.hypot(5, 5) + 2
+    assert get_length(contour, map_size=20, tolerance=4.0) == pytest.approx(
+        expected_length
+    )
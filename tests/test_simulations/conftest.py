@@ -0,0 +1,59 @@
+import pytest
+
+from machwave.models.materials.metals import Al6063T5, Steel
+from machwave.models.materials.polymers import EPDM
+from machwave.models.propulsion import SolidMotor
+from machwave.models.propulsion.grain import Grain
+from machwave.models.propulsion.grain.geometries.bates import BatesSegment
+from machwave.models.propulsion.propellants.solid import KNSB_NAKKA
+from machwave.models.propulsion.structure import MotorStructure, Nozzle
+from machwave.models.propulsion.structure.chamber import CombustionChamber
+from machwave.models.propulsion.thermals import ThermalLiner
+from machwave.models.recovery import Recovery
+from machwave.models.rocket import Rocket
+from machwave.models.rocket.fuselage import Fuselage
+
+
+@pytest.fixture
+def small_rocket():
+    """
+    Single BATES segment motor on a light rocket, small enough for the
+    simulations to run in a fraction of a second.
+    """
+    grain = Grain()
+    grain.add_segment(
+        BatesSegment(
+            outer_diameter=41e-3,
+            core_diameter=15e-3,
+            length=70e-3,
+            spacing=5e-3,
+        )
+    )
+    chamber = CombustionChamber(
+        casing_inner_diameter=44e-3,
+        outer_diameter=48e-3,
+        liner=ThermalLiner(thickness=1.5e-3, material=EPDM),
+        length=80e-3,
+        casing_material=Al6063T5(),
+        bulkhead_material=Al6063T5(),
+    )
+    nozzle = Nozzle(
+        throat_diameter=8e-3,
+        divergent_angle=12,
+        convergent_angle=45,
+        expansion_ratio=4,
+        material=Steel(),
+    )
+    structure = MotorStructure(
+        safety_factor=4, dry_mass=0.5, nozzle=nozzle, chamber=chamber
+    )
+    motor = SolidMotor(grain=grain, propellant=KNSB_NAKKA, structure=structure)
+
+    return Rocket(
+        propulsion=motor,
+        recovery=Recovery(),
+        fuselage=Fuselage(
+            length=1000e-3, drag_coefficient=0.5, outer_diameter=55e-3
+        ),
+        mass_without_motor=1.0,
+    )
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+
+from machwave.models.atmosphere.atm_1976 import Atmosphere1976
+from machwave.simulations.ballistics import (
+    BallisticSimulation,
+    BallisticSimulationParameters,
+    _interpolate,
+)
+
+
+def _get_params(time: np.ndarray, thrust: np.ndarray):
+    return BallisticSimulationParameters(
+        thrust=thrust,
+        motor_dry_mass=5.0,
+        initial_propellant_mass=2.0,
+        time=time,
+        d_t=0.01,
+        initial_elevation_amsl=0.0,
+        rail_length=5.0,
+    )
+
+
+def test_interpolate_matches_numpy():
+    time = np.array([0.0, 0.5, 1.0, 2.0])
+    thrust = np.array([0.0, 100.0, 80.0, 10.0])
+
+    for j, x in [(0, 0.25), (1, 0.75), (2, 1.5), (2, 2.0)]:
+        assert _interpolate(time, thrust, x, j) == pytest.approx(
+            np.interp(x, time, thrust)
+        )
+
+
+def test_interpolate_zero_width_interval():
+    time = np.array([0.0, 1.0, 1.0, 2.0])
+    thrust = np.array([0.0, 100.0, 50.0, 10.0])
+
+    assert _interpolate(time, thrust, 1.0, 1) == np.interp(1.0, time, thrust)
+
+
+def test_ballistic_parameters_valid_tables():
+    params = _get_params(np.array([0.0, 1.0, 2.0]), np.array([0, 50, 0]))
+    assert params.d_t == 0.01
+
+
+def test_ballistic_parameters_repeated_time():
+    params = _get_params(np.array([0.0, 1.0, 1.0]), np.array([0, 50, 0]))
+    assert params.d_t == 0.01
+
+
+def test_ballistic_parameters_single_point():
+    params = _get_params(np.array([0.0]), np.array([0]))
+    assert params.d_t == 0.01
+
+
+def test_ballistic_parameters_decreasing_time():
+    with pytest.raises(ValueError):
+        _get_params(np.array([0.0, 1.0, 0.5]), np.array([0, 50, 0]))
+
+
+def test_ballistic_parameters_empty_tables():
+    with pytest.raises(ValueError):
+        _get_params(np.array([]), np.array([]))
+
+
+def test_ballistic_parameters_non_finite_thrust():
+    with pytest.raises(ValueError):
+        _get_params(np.array([0.0, 1.0, 2.0]), np.array([0, np.nan, 0]))
+
+
+def test_ballistic_parameters_length_mismatch():
+    with pytest.raises(ValueError):
+        _get_params(np.array([0.0, 1.0, 2.0]), np.array([0, 50]))
+
+
+def test_ballistic_parameters_replace_shares_tables():
+    params = _get_params(np.array([0.0, 1.0, 2.0]), np.array([0, 50, 0]))
+    new_params = params.replace(d_t=0.05, rail_length=8.0)
+
+    assert (new_params.d_t, new_params.rail_length) == (0.05, 8.0)
+    assert (params.d_t, params.rail_length) == (0.01, 5.0)
+    assert new_params.thrust is params.thrust
+    assert new_params.time is params.time
+
+
+def test_ballistic_parameters_replace_validates():
+    params = _get_params(np.array([0.0, 1.0, 2.0]), np.array([0, 50, 0]))
+
+    with pytest.raises(ValueError):
+        params.replace(time=np.array([0.0, 2.0, 1.0]))
+
+    with pytest.raises(ValueError):
+        params.replace(time_step=0.05)
+
+
+def test_ballistic_simulation_run(small_rocket):
+    """
+    Regression test of the run loop on a synthetic thrust curve. The
+    reference values were obtained with the original np.interp-based
+    implementation.
+    """
+    params = BallisticSimulationParameters(
+        thrust=np.array([0.0, 100.0, 80.0, 0.0]),
+        motor_dry_mass=0.5,
+        initial_propellant_mass=(
+            small_rocket.propulsion.initial_propellant_mass
+        ),
+        time=np.array([0.0, 0.1, 0.9, 1.0]),
+        d_t=0.01,
+        initial_elevation_amsl=0.0,
+        rail_length=3.0,
+    )
+    simulation = BallisticSimulation(
+        rocket=small_rocket, atmosphere=Atmosphere1976(), params=params
+    )
+    t, ballistic_operation = simulation.run()
+
+    # The thrust curve ends at t = 1 s, from which the vehicle mass no
+    # longer changes:
+    end_of_powered_phase = 100
+
+    assert t[end_of_powered_phase] == pytest.approx(1.0)
+    assert ballistic_operation.vehicle_mass[end_of_powered_phase - 1] > (
+        ballistic_operation.vehicle_mass[-1]
+    )
+    np.testing.assert_allclose(
+        ballistic_operation.vehicle_mass[end_of_powered_phase:],
+        ballistic_operation.vehicle_mass[-1],
+    )
+
+    assert len(t) == 982
+    assert t[-1] == pytest.approx(9.81)
+    assert np.max(ballistic_operation.y) == pytest.approx(105.86919069326142)
+    assert t[np.argmax(ballistic_operation.y)] == pytest.approx(5.11)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from machwave.models.atmosphere.atm_1976 import Atmosphere1976
+from machwave.operations.internal_ballistics import SRMOperation
+from machwave.simulations.internal_balistics_coupled import (
+    InternalBallisticsCoupled,
+    InternalBallisticsCoupledParams,
+)
+
+
+def test_internal_ballistics_coupled_run(small_rocket):
+    """
+    Regression test of the powered and coast phases of the coupled run.
+    The reference values were obtained with the original single-loop
+    implementation.
+    """
+    params = InternalBallisticsCoupledParams(
+        atmosphere=Atmosphere1976(),
+        d_t=2e-3,
+        dd_t=10,
+        initial_elevation_amsl=0,
+        igniter_pressure=1e6,
+        rail_length=3,
+    )
+    simulation = InternalBallisticsCoupled(rocket=small_rocket, params=params)
+    motor_operation, ballistic_operation = simulation.run()
+
+    # The powered phase ends on the motor's last time step, after which
+    # the flight is stepped with d_t * dd_t:
+    end_of_powered_phase = len(motor_operation.t) - 1
+
+    assert end_of_powered_phase == 840
+    assert simulation.t[end_of_powered_phase] == pytest.approx(1.68)
+    assert motor_operation.m_prop[-1] == 0
+    np.testing.assert_allclose(
+        np.diff(simulation.t[end_of_powered_phase:]), 0.02
+    )
+
+    assert len(simulation.t) == 1426
+    assert len(ballistic_operation.y) == len(simulation.t)
+    assert simulation.t[-1] == pytest.approx(13.38)
+    assert np.max(ballistic_operation.y) == pytest.approx(190.3354143824966)
+
+
+def test_srm_operation_iterate_returns_latest_values(small_rocket):
+    """
+    The coupled loop carries the propellant mass and thrust returned by
+    iterate() instead of indexing the operation vectors, so they must be
+    the latest stored values, also after the end of thrust.
+    """
+    motor_operation = SRMOperation(
+        motor=small_rocket.propulsion,
+        initial_pressure=1e6,
+        initial_atmospheric_pressure=101325,
+    )
+
+    for _ in range(900):
+        propellant_mass, thrust = motor_operation.iterate(2e-3, 101325)
+
+        assert propellant_mass == motor_operation.m_prop[-1]
+        assert thrust == motor_operation.thrust[-1]
+
+    assert motor_operation.end_thrust
+    assert propellant_mass == 0